@@ -1,20 +1,38 @@
+from collections import defaultdict
+
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import CustomUser, LeaveBalance, LeaveRequest, LeaveApprovalStep, TripRequest, TripReportRecipient, Meeting
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Substr
+from .models import CustomUser, LeaveBalance, LeaveRequest, LeaveApprovalStep, TripRequest, TripReportRecipient, Meeting, _leave_days
 
 # --- Custom Actions ---
 @admin.action(description='[승인] 선택한 휴가 신청 승인 및 연차 차감')
 def approve_leaves(modeladmin, request, queryset):
-    for leave_request in queryset:
-        if leave_request.status == 'approved':
-            continue
-        leave_request.status = 'approved'
-        leave_request.save()
-        if leave_request.days and leave_request.days > 0:
-            balance, _ = LeaveBalance.objects.get_or_create(user=leave_request.user)
-            current_used = balance.used_leave if balance.used_leave else 0
-            balance.used_leave = current_used + leave_request.days
-            balance.save()
+    with transaction.atomic():
+        pending = queryset.exclude(status='approved')
+        used_by_user = defaultdict(float)
+        backfill = []
+        rows = pending.values_list('id', 'user_id', 'days', 'leave_type', 'start_date', 'end_date')
+        for leave_id, user_id, days, leave_type, start, end in rows:
+            # days 컬럼 추가(0002) 이전 신청은 값이 비어 있으므로 save()와 같은 방식으로 계산해 채운다
+            if days is None and start and end:
+                days = _leave_days(leave_type, start, end)
+                backfill.append(LeaveRequest(id=leave_id, days=days))
+            if days and days > 0:
+                used_by_user[user_id] += days
+        if backfill:
+            LeaveRequest.objects.bulk_update(backfill, ['days'])
+        pending.update(status='approved')
+        if not used_by_user:
+            return
+        LeaveBalance.objects.bulk_create(
+            [LeaveBalance(user_id=user_id) for user_id in used_by_user],
+            ignore_conflicts=True,
+        )
+        for user_id, total in used_by_user.items():
+            LeaveBalance.objects.filter(user_id=user_id).update(used_leave=F('used_leave') + total)
 
 @admin.action(description='[승인] 선택한 출장 신청 승인')
 def approve_trips(modeladmin, request, queryset):
@@ -29,20 +47,33 @@ class CustomUserAdmin(UserAdmin):
         ('추가 정보', {'fields': ('department', 'position', 'join_date')}),
     )
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        # 목록 화면에서는 표시 컬럼만 조회 (변경 폼은 전체 필드 필요)
+        match = getattr(request, 'resolver_match', None)
+        if match and match.url_name == 'attendance_customuser_changelist':
+            qs = qs.only('id', 'username', 'department', 'position', 'join_date', 'is_staff')
+        return qs
+
 @admin.register(LeaveBalance)
 class LeaveBalanceAdmin(admin.ModelAdmin):
     list_display = ('user', 'total_leave', 'used_leave', 'remaining_leave')
-    
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            remaining=F('total_leave') - F('used_leave'),
+        ).select_related('user')
+
     def remaining_leave(self, obj):
-        total = obj.total_leave if obj.total_leave else 0
-        used = obj.used_leave if obj.used_leave else 0
-        return total - used
+        return obj.remaining
     remaining_leave.short_description = '잔여 연차'
+    remaining_leave.admin_order_field = 'remaining'
 
 @admin.register(LeaveRequest)
 class LeaveRequestAdmin(admin.ModelAdmin):
     list_display = ('user', 'leave_type', 'start_date', 'end_date', 'days', 'status')
     list_filter = ('status', 'leave_type')
+    list_select_related = ('user',)
     actions = [approve_leaves]
 
 @admin.register(TripRequest)
@@ -50,18 +81,32 @@ class TripRequestAdmin(admin.ModelAdmin):
     # 목적 요약과 보고서 요약 모두 표시
     list_display = ('user', 'location', 'purpose_summary', 'start_date', 'end_date', 'status', 'report_preview')
     list_filter = ('status',)
+    list_select_related = ('user',)
     actions = [approve_trips]
     
     fields = ('user', 'location', 'purpose', 'start_date', 'end_date', 'status', 'report_content')
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        # 목록에는 앞부분만 필요하므로 긴 본문은 DB에서 잘라서 가져옴 (변경 폼은 전체 본문 필요)
+        match = getattr(request, 'resolver_match', None)
+        if match and match.url_name == 'attendance_triprequest_changelist':
+            qs = qs.annotate(
+                purpose_short=Substr('purpose', 1, 21),
+                report_short=Substr('report_content', 1, 31),
+            ).defer('purpose', 'report_content')
+        return qs
+
     def purpose_summary(self, obj):
-        return obj.purpose[:20] + "..." if len(obj.purpose) > 20 else obj.purpose
+        text = obj.purpose_short or ''
+        return text[:20] + "..." if len(text) > 20 else text
     purpose_summary.short_description = "출장 목적"
 
     def report_preview(self, obj):
-        if not obj.report_content:
+        if not obj.report_short:
             return "-"
-        return obj.report_content[:30] + "..." if len(obj.report_content) > 30 else obj.report_content
+        text = obj.report_short
+        return text[:30] + "..." if len(text) > 30 else text
     report_preview.short_description = "보고서 내용"
 
 
@@ -69,15 +114,18 @@ class TripRequestAdmin(admin.ModelAdmin):
 class LeaveApprovalStepAdmin(admin.ModelAdmin):
     list_display = ('leave', 'order', 'approver', 'status', 'decided_at')
     list_filter = ('status',)
+    list_select_related = ('leave__user', 'approver')
 
 
 @admin.register(TripReportRecipient)
 class TripReportRecipientAdmin(admin.ModelAdmin):
     list_display = ('user',)
+    list_select_related = ('user',)
 
 
 @admin.register(Meeting)
 class MeetingAdmin(admin.ModelAdmin):
     list_display = ('user', 'subject', 'start_date', 'end_date', 'all_day')
     search_fields = ('subject', 'user__username')
+    list_select_related = ('user',)
     filter_horizontal = ('participants',)
\ No newline at end of file
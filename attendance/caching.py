@@ -0,0 +1,97 @@
+import hashlib
+import json
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
+
+from .models import TripReportRecipient
+
+# 캐시 조회/무효화 함수를 한곳에 모아 signals가 views/forms를 import하지 않아도 되게 한다
+
+LEAVE_APPROVER_GROUPS = ['휴가 결재권자', '경영관리부']
+APPROVER_CHOICES_CACHE_KEY = 'leave_approvers'
+APPROVER_CHOICES_TTL = 60
+
+
+def get_approver_choices():
+    """Return cached (id, username) pairs for users who can approve leave."""
+    User = get_user_model()
+    # EXISTS semi-join instead of JOIN + DISTINCT on the group membership table
+    approver_groups = Group.objects.filter(name__in=LEAVE_APPROVER_GROUPS, user=OuterRef('pk'))
+    return cache.get_or_set(
+        APPROVER_CHOICES_CACHE_KEY,
+        lambda: list(
+            User.objects.filter(Exists(approver_groups))
+            .order_by('username')
+            .values_list('id', 'username')
+        ),
+        APPROVER_CHOICES_TTL,
+    )
+
+
+def invalidate_approver_choices():
+    cache.delete(APPROVER_CHOICES_CACHE_KEY)
+
+
+PARTICIPANT_CHOICES_CACHE_KEY = 'participant_choices'
+PARTICIPANT_CHOICES_TTL = 60
+
+
+def get_participant_choices():
+    """Return cached (id, username) pairs for the participant picker."""
+    User = get_user_model()
+    return cache.get_or_set(
+        PARTICIPANT_CHOICES_CACHE_KEY,
+        lambda: list(User.objects.order_by('username').values_list('id', 'username')),
+        PARTICIPANT_CHOICES_TTL,
+    )
+
+
+def invalidate_participant_choices():
+    cache.delete(PARTICIPANT_CHOICES_CACHE_KEY)
+
+
+TRIP_RECIPIENT_IDS_CACHE_KEY = 'trip_recipient_ids'
+TRIP_RECIPIENT_IDS_TTL = 60
+
+
+def get_trip_recipient_ids():
+    """Return the (small, rarely changing) set of trip report recipient user ids."""
+    return cache.get_or_set(
+        TRIP_RECIPIENT_IDS_CACHE_KEY,
+        lambda: frozenset(TripReportRecipient.objects.values_list('user_id', flat=True)),
+        TRIP_RECIPIENT_IDS_TTL,
+    )
+
+
+def invalidate_trip_recipient_ids():
+    cache.delete(TRIP_RECIPIENT_IDS_CACHE_KEY)
+
+
+TRIP_REPORTS_CACHE_TTL = 60
+TRIP_REPORTS_VERSION_KEY = 'trip_reports_version'
+
+
+def trip_reports_cache_key(*parts) -> str:
+    # 버전 키를 바꾸면 이전 필터 조합의 캐시가 모두 무효화된다 (접두사 삭제 불필요)
+    version = cache.get_or_set(TRIP_REPORTS_VERSION_KEY, lambda: uuid.uuid4().hex, None)
+    # 쿼리스트링 값이 그대로 들어오므로 구분자 충돌이 없는 JSON 배열로 직렬화해 해시
+    digest = hashlib.blake2b(json.dumps(parts).encode(), digest_size=16).hexdigest()
+    return f'trip_reports:{version}:{digest}'
+
+
+def invalidate_trip_reports():
+    cache.delete(TRIP_REPORTS_VERSION_KEY)
+
+
+def get_group_names(user):
+    """Return the user's group names, memoized on the user object for the request."""
+    # 뷰의 권한 검사와 템플릿 필터가 한 요청에서 여러 번 호출하므로 그룹명 집합을 사용자 객체에 보관
+    names = getattr(user, '_group_names_cache', None)
+    if names is None:
+        names = {g.name for g in user.groups.all()}
+        user._group_names_cache = names
+    return names
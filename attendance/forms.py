@@ -1,51 +1,107 @@
+from types import MappingProxyType
+
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
-from django.contrib.auth import get_user_model
 
+from .caching import get_approver_choices, get_participant_choices
 from .models import CustomUser, LeaveRequest, TripRequest, Meeting, PersonalEvent
 
+# Shared read-only widget attrs; widgets copy attrs on construction.
+_FORM_CONTROL = MappingProxyType({'class': 'form-control'})
+_FORM_SELECT = MappingProxyType({'class': 'form-select'})
+_DATE_INPUT = MappingProxyType({'type': 'date', 'class': 'form-control'})
+_DATETIME_INPUT = MappingProxyType({'type': 'datetime-local', 'class': 'form-control', 'step': '600'})
+_TEXTAREA = MappingProxyType({'class': 'form-control', 'rows': 3})
+_TEXTAREA_LARGE = MappingProxyType({'class': 'form-control', 'rows': 5})
+_CHECKBOX = MappingProxyType({'class': 'form-check-input'})
+_PARTICIPANTS_SELECT = MappingProxyType({'class': 'form-select d-none', 'size': 8, 'style': 'display:none;'})
+
+def _participants_field():
+    return forms.TypedMultipleChoiceField(
+        coerce=int,
+        required=False,
+        label='동석자 (복수 선택 가능)',
+        widget=forms.SelectMultiple(attrs=_PARTICIPANTS_SELECT),
+    )
+
+
+class ParticipantChoicesMixin:
+    """Fill the participants field from cached choices instead of a User queryset."""
+
+    def _init_participants(self):
+        self.fields['participants'].choices = get_participant_choices()
+        # model_to_dict() gives User instances; the plain choice field compares by id
+        initial = self.initial.get('participants') or []
+        self.initial['participants'] = [getattr(p, 'pk', p) for p in initial]
+
+
+_VALID_MINUTES = frozenset(range(0, 60, 10))
+
+
+def _invalid_step(dt):
+    return dt is not None and (dt.minute not in _VALID_MINUTES or dt.second or dt.microsecond)
+
+
+def _validate_datetime_range(form, cleaned):
+    """Shared 10-minute step and ordering checks for start/end datetime forms."""
+    start = cleaned.get('start_date')
+    end = cleaned.get('end_date')
+
+    if cleaned.get('all_day'):
+        # 종일인 경우 시각 단위 검증은 생략 (후처리에서 정규화)
+        return
+
+    if _invalid_step(start):
+        form.add_error('start_date', '10분 단위(분: 00, 10, 20, 30, 40, 50)로 입력해주세요.')
+    if _invalid_step(end):
+        form.add_error('end_date', '10분 단위(분: 00, 10, 20, 30, 40, 50)로 입력해주세요.')
+
+    if start and end and end < start:
+        form.add_error('end_date', '종료 일시는 시작 일시보다 빠를 수 없습니다.')
+
 
 class SignUpForm(UserCreationForm):
-    email = forms.EmailField(required=True, widget=forms.EmailInput(attrs={'class': 'form-control'}))
-    department = forms.CharField(max_length=50, required=False, widget=forms.TextInput(attrs={'class': 'form-control'}))
-    position = forms.CharField(max_length=50, required=False, widget=forms.TextInput(attrs={'class': 'form-control'}))
-    join_date = forms.DateField(required=True, widget=forms.DateInput(attrs={'type': 'date', 'class': 'form-control'}), label='입사일')
+    email = forms.EmailField(required=True, widget=forms.EmailInput(attrs=_FORM_CONTROL))
+    department = forms.CharField(max_length=50, required=False, widget=forms.TextInput(attrs=_FORM_CONTROL))
+    position = forms.CharField(max_length=50, required=False, widget=forms.TextInput(attrs=_FORM_CONTROL))
+    join_date = forms.DateField(required=True, widget=forms.DateInput(attrs=_DATE_INPUT), label='입사일')
 
     class Meta:
         model = CustomUser
         fields = ('username', 'email', 'department', 'position', 'join_date', 'password1', 'password2')
         widgets = {
-            'username': forms.TextInput(attrs={'class': 'form-control'}),
+            'username': forms.TextInput(attrs=_FORM_CONTROL),
         }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Normalize password widgets to Bootstrap form-control
-        self.fields['password1'].widget.attrs.update({'class': 'form-control'})
-        self.fields['password2'].widget.attrs.update({'class': 'form-control'})
+        for name in ('password1', 'password2'):
+            attrs = self.fields[name].widget.attrs
+            if attrs.get('class') != 'form-control':
+                attrs['class'] = 'form-control'
 
 
 class LeaveForm(forms.ModelForm):
-    approver1 = forms.ModelChoiceField(queryset=None, required=False, label='결재자 1', widget=forms.Select(attrs={'class': 'form-select'}))
-    approver2 = forms.ModelChoiceField(queryset=None, required=False, label='결재자 2', widget=forms.Select(attrs={'class': 'form-select'}))
-    approver3 = forms.ModelChoiceField(queryset=None, required=False, label='결재자 3', widget=forms.Select(attrs={'class': 'form-select'}))
+    approver1 = forms.TypedChoiceField(coerce=int, empty_value=None, required=False, label='결재자 1', widget=forms.Select(attrs=_FORM_SELECT))
+    approver2 = forms.TypedChoiceField(coerce=int, empty_value=None, required=False, label='결재자 2', widget=forms.Select(attrs=_FORM_SELECT))
+    approver3 = forms.TypedChoiceField(coerce=int, empty_value=None, required=False, label='결재자 3', widget=forms.Select(attrs=_FORM_SELECT))
 
     class Meta:
         model = LeaveRequest
         fields = ['leave_type', 'start_date', 'end_date', 'reason']
         widgets = {
-            'leave_type': forms.Select(attrs={'class': 'form-select'}),
-            'start_date': forms.DateInput(attrs={'type': 'date', 'class': 'form-control'}),
-            'end_date': forms.DateInput(attrs={'type': 'date', 'class': 'form-control'}),
-            'reason': forms.Textarea(attrs={'class': 'form-control', 'rows': 3}),
+            'leave_type': forms.Select(attrs=_FORM_SELECT),
+            'start_date': forms.DateInput(attrs=_DATE_INPUT),
+            'end_date': forms.DateInput(attrs=_DATE_INPUT),
+            'reason': forms.Textarea(attrs=_TEXTAREA),
         }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        User = get_user_model()
-        approvers = User.objects.filter(groups__name__in=['휴가 결재권자', '경영관리부']).distinct().order_by('username')
+        choices = [('', '---------')] + get_approver_choices()
         for key in ['approver1', 'approver2', 'approver3']:
-            self.fields[key].queryset = approvers
+            self.fields[key].choices = choices
 
     def clean(self):
         cleaned = super().clean()
@@ -58,52 +114,33 @@ class LeaveForm(forms.ModelForm):
         return cleaned
 
 
-class TripForm(forms.ModelForm):
+class TripForm(ParticipantChoicesMixin, forms.ModelForm):
+    participants = _participants_field()
+
     class Meta:
         model = TripRequest
         fields = ['location', 'purpose', 'start_date', 'end_date', 'all_day', 'participants']
         widgets = {
-            'location': forms.TextInput(attrs={'class': 'form-control'}),
-            'purpose': forms.Textarea(attrs={'class': 'form-control', 'rows': 3}),
-            'start_date': forms.DateTimeInput(attrs={'type': 'datetime-local', 'class': 'form-control', 'step': '600'}),
-            'end_date': forms.DateTimeInput(attrs={'type': 'datetime-local', 'class': 'form-control', 'step': '600'}),
-            'all_day': forms.CheckboxInput(attrs={'class': 'form-check-input'}),
-            'participants': forms.SelectMultiple(attrs={'class': 'form-select d-none', 'size': 8, 'style': 'display:none;'}),
+            'location': forms.TextInput(attrs=_FORM_CONTROL),
+            'purpose': forms.Textarea(attrs=_TEXTAREA),
+            'start_date': forms.DateTimeInput(attrs=_DATETIME_INPUT),
+            'end_date': forms.DateTimeInput(attrs=_DATETIME_INPUT),
+            'all_day': forms.CheckboxInput(attrs=_CHECKBOX),
         }
         labels = {
             'start_date': '시작 일시',
             'end_date': '종료 일시',
             'all_day': '종일',
-            'participants': '동석자 (복수 선택 가능)',
         }
 
     def clean(self):
         cleaned = super().clean()
-        start = cleaned.get('start_date')
-        end = cleaned.get('end_date')
-        all_day = cleaned.get('all_day')
-
-        if all_day:
-            # 종일인 경우 시각 단위 검증은 생략 (후처리에서 정규화)
-            return cleaned
-
-        def _invalid_step(dt):
-            return dt and (dt.minute % 10 != 0 or dt.second != 0 or dt.microsecond != 0)
-
-        if _invalid_step(start):
-            self.add_error('start_date', '10분 단위(분: 00, 10, 20, 30, 40, 50)로 입력해주세요.')
-        if _invalid_step(end):
-            self.add_error('end_date', '10분 단위(분: 00, 10, 20, 30, 40, 50)로 입력해주세요.')
-
-        if start and end and end < start:
-            self.add_error('end_date', '종료 일시는 시작 일시보다 빠를 수 없습니다.')
-
+        _validate_datetime_range(self, cleaned)
         return cleaned
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        User = get_user_model()
-        self.fields['participants'].queryset = User.objects.order_by('username')
+        self._init_participants()
 
 
 class TripReportForm(forms.ModelForm):
@@ -111,58 +148,40 @@ class TripReportForm(forms.ModelForm):
         model = TripRequest
         fields = ['report_content']
         widgets = {
-            'report_content': forms.Textarea(attrs={'class': 'form-control', 'rows': 5}),
+            'report_content': forms.Textarea(attrs=_TEXTAREA_LARGE),
         }
         labels = {
             'report_content': '출장 결과 보고',
         }
 
 
-class MeetingForm(forms.ModelForm):
+class MeetingForm(ParticipantChoicesMixin, forms.ModelForm):
+    participants = _participants_field()
+
     class Meta:
         model = Meeting
         fields = ['subject', 'start_date', 'end_date', 'all_day', 'participants']
         widgets = {
-            'subject': forms.TextInput(attrs={'class': 'form-control'}),
-            'start_date': forms.DateTimeInput(attrs={'type': 'datetime-local', 'class': 'form-control', 'step': '600'}),
-            'end_date': forms.DateTimeInput(attrs={'type': 'datetime-local', 'class': 'form-control', 'step': '600'}),
-            'all_day': forms.CheckboxInput(attrs={'class': 'form-check-input'}),
-            'participants': forms.SelectMultiple(attrs={'class': 'form-select d-none', 'size': 8, 'style': 'display:none;'}),
+            'subject': forms.TextInput(attrs=_FORM_CONTROL),
+            'start_date': forms.DateTimeInput(attrs=_DATETIME_INPUT),
+            'end_date': forms.DateTimeInput(attrs=_DATETIME_INPUT),
+            'all_day': forms.CheckboxInput(attrs=_CHECKBOX),
         }
         labels = {
             'subject': '미팅 주제',
             'start_date': '시작 일시',
             'end_date': '종료 일시',
             'all_day': '종일',
-            'participants': '동석자 (복수 선택 가능)',
         }
 
     def clean(self):
         cleaned = super().clean()
-        start = cleaned.get('start_date')
-        end = cleaned.get('end_date')
-        all_day = cleaned.get('all_day')
-
-        if all_day:
-            return cleaned
-
-        def _invalid_step(dt):
-            return dt and (dt.minute % 10 != 0 or dt.second != 0 or dt.microsecond != 0)
-
-        if _invalid_step(start):
-            self.add_error('start_date', '10분 단위(분: 00, 10, 20, 30, 40, 50)로 입력해주세요.')
-        if _invalid_step(end):
-            self.add_error('end_date', '10분 단위(분: 00, 10, 20, 30, 40, 50)로 입력해주세요.')
-
-        if start and end and end < start:
-            self.add_error('end_date', '종료 일시는 시작 일시보다 빠를 수 없습니다.')
-
+        _validate_datetime_range(self, cleaned)
         return cleaned
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        User = get_user_model()
-        self.fields['participants'].queryset = User.objects.order_by('username')
+        self._init_participants()
 
 
 class PersonalEventForm(forms.ModelForm):
@@ -170,12 +189,12 @@ class PersonalEventForm(forms.ModelForm):
         model = PersonalEvent
         fields = ['title', 'location', 'description', 'start_date', 'end_date', 'all_day']
         widgets = {
-            'title': forms.TextInput(attrs={'class': 'form-control'}),
-            'location': forms.TextInput(attrs={'class': 'form-control'}),
-            'description': forms.Textarea(attrs={'class': 'form-control', 'rows': 3}),
-            'start_date': forms.DateTimeInput(attrs={'type': 'datetime-local', 'class': 'form-control', 'step': '600'}),
-            'end_date': forms.DateTimeInput(attrs={'type': 'datetime-local', 'class': 'form-control', 'step': '600'}),
-            'all_day': forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+            'title': forms.TextInput(attrs=_FORM_CONTROL),
+            'location': forms.TextInput(attrs=_FORM_CONTROL),
+            'description': forms.Textarea(attrs=_TEXTAREA),
+            'start_date': forms.DateTimeInput(attrs=_DATETIME_INPUT),
+            'end_date': forms.DateTimeInput(attrs=_DATETIME_INPUT),
+            'all_day': forms.CheckboxInput(attrs=_CHECKBOX),
         }
         labels = {
             'title': '제목',
@@ -188,22 +207,5 @@ class PersonalEventForm(forms.ModelForm):
 
     def clean(self):
         cleaned = super().clean()
-        start = cleaned.get('start_date')
-        end = cleaned.get('end_date')
-        all_day = cleaned.get('all_day')
-
-        if all_day:
-            return cleaned
-
-        def _invalid_step(dt):
-            return dt and (dt.minute % 10 != 0 or dt.second != 0 or dt.microsecond != 0)
-
-        if _invalid_step(start):
-            self.add_error('start_date', '10분 단위(분: 00, 10, 20, 30, 40, 50)로 입력해주세요.')
-        if _invalid_step(end):
-            self.add_error('end_date', '10분 단위(분: 00, 10, 20, 30, 40, 50)로 입력해주세요.')
-
-        if start and end and end < start:
-            self.add_error('end_date', '종료 일시는 시작 일시보다 빠를 수 없습니다.')
-
+        _validate_datetime_range(self, cleaned)
         return cleaned
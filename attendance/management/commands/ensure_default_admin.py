@@ -1,6 +1,21 @@
 import os
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+from attendance.models import DefaultAdminFingerprint
+
+
+def _password_fingerprint(password, password_hash):
+    # Cheap HMAC over the env password and the stored hash; lets a later boot
+    # skip the slow check_password() when neither side has changed.
+    return salted_hmac('ensure_default_admin', f"{password}\0{password_hash}").hexdigest()
+
+
+def _store_fingerprint(user, password):
+    DefaultAdminFingerprint.objects.update_or_create(
+        user=user, defaults={"fingerprint": _password_fingerprint(password, user.password)},
+    )
 
 
 class Command(BaseCommand):
@@ -25,32 +40,34 @@ class Command(BaseCommand):
             },
         )
 
-        updated = False
-
         if created:
             user.set_password(password)
-            user.save()
+            User.objects.filter(pk=user.pk).update(password=user.password)
+            _store_fingerprint(user, password)
             self.stdout.write(self.style.SUCCESS(f"Created default admin '{username}'."))
             return
 
+        changed = {}
+
         if email and user.email != email:
-            user.email = email
-            updated = True
+            changed["email"] = email
 
         if not user.is_staff:
-            user.is_staff = True
-            updated = True
+            changed["is_staff"] = True
 
         if not user.is_superuser:
-            user.is_superuser = True
-            updated = True
+            changed["is_superuser"] = True
 
-        if not user.check_password(password):
-            user.set_password(password)
-            updated = True
+        # 지문은 DB에 남겨 재시작 후에도 유지 — 환경변수 비밀번호나 저장된 해시가 바뀐 경우에만 PBKDF2 검사
+        stored = DefaultAdminFingerprint.objects.filter(user=user).values_list("fingerprint", flat=True).first()
+        if not stored or not constant_time_compare(stored, _password_fingerprint(password, user.password)):
+            if not user.check_password(password):
+                user.set_password(password)
+                changed["password"] = user.password
+            _store_fingerprint(user, password)
 
-        if updated:
-            user.save()
+        if changed:
+            User.objects.filter(pk=user.pk).update(**changed)
             self.stdout.write(self.style.SUCCESS(f"Updated default admin '{username}'."))
         else:
             self.stdout.write(f"Default admin '{username}' already up-to-date.")
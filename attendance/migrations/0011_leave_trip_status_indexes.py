@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0010_customuser_feed_token'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='leaverequest',
+            index=models.Index(fields=['status', 'user'], name='leave_status_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leaverequest',
+            index=models.Index(fields=['status', 'start_date'], name='leave_status_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='triprequest',
+            index=models.Index(fields=['status', 'user'], name='trip_status_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='triprequest',
+            index=models.Index(fields=['status', 'start_date'], name='trip_status_start_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0011_leave_trip_status_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='leaverequest',
+            name='leave_status_user_idx',
+        ),
+        migrations.AddIndex(
+            model_name='leaverequest',
+            index=models.Index(fields=['user', 'status', 'start_date'], name='leave_user_status_start_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='triprequest',
+            name='trip_status_user_idx',
+        ),
+        migrations.AddIndex(
+            model_name='triprequest',
+            index=models.Index(fields=['user', 'status', 'start_date'], name='trip_user_status_start_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0012_leave_trip_user_status_start_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='triprequest',
+            index=models.Index(fields=['-start_date'], name='trip_start_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='triprequest',
+            index=models.Index(fields=['end_date'], name='trip_end_idx'),
+        ),
+    ]
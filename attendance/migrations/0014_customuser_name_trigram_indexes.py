@@ -0,0 +1,38 @@
+from django.db import migrations
+
+# Django은 PostgreSQL에서 icontains를 UPPER("col"::text) LIKE UPPER('%q%')로 만들기 때문에
+# 같은 식에 대한 trigram GIN 인덱스여야 보고함/외부일정 검색에서 사용된다.
+TRIGRAM_INDEXES = {
+    'customuser_username_trgm_idx': 'username',
+    'customuser_first_name_trgm_idx': 'first_name',
+    'customuser_last_name_trgm_idx': 'last_name',
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Create pg_trgm indexes for the user name search; no-op on other databases."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON attendance_customuser '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('attendance', '0013_trip_start_end_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
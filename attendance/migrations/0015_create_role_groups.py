@@ -0,0 +1,26 @@
+from django.db import migrations
+
+# 마이그레이션 시점의 역할 그룹 목록 (views.ROLE_GROUPS와 동일하게 유지)
+ROLE_GROUPS = ['관리자', '휴가 결재권자', '출장 결재권자', '경영관리부', '외부일정 보고 수신자']
+
+
+def create_role_groups(apps, schema_editor):
+    """Create the role groups once at deploy time instead of on every admin page request."""
+    Group = apps.get_model('auth', 'Group')
+    for name in ROLE_GROUPS:
+        Group.objects.get_or_create(name=name)
+
+
+def noop_reverse(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('attendance', '0014_customuser_name_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_role_groups, noop_reverse),
+    ]
@@ -1,7 +1,26 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.conf import settings
-from datetime import timedelta, date
+from django.core.exceptions import ValidationError
+from datetime import date
+
+
+def _count_weekdays(start, end):
+    """Count Mon-Fri days in [start, end] without walking the range day by day."""
+    total = (end - start).days + 1
+    if total <= 0:
+        return 0
+    full_weeks, extra = divmod(total, 7)
+    # 5=토요일, 6=일요일 (주말 제외)
+    first = start.weekday()
+    return full_weeks * 5 + sum(1 for i in range(extra) if (first + i) % 7 < 5)
+
+
+def _leave_days(leave_type, start, end):
+    """Leave days for a request: 0.5 for half days, otherwise weekdays in [start, end]."""
+    if leave_type in ('반차', '오전반차', '오후반차'):
+        return 0.5
+    return float(_count_weekdays(start, end))
 
 
 class CustomUser(AbstractUser):
@@ -37,20 +56,16 @@ class LeaveRequest(models.Model):
     rejection_reason = models.TextField(blank=True, null=True)
     days = models.FloatField(null=True, blank=True, help_text="자동 계산된 휴가 일수(주말 제외)")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'status', 'start_date'], name='leave_user_status_start_idx'),
+            models.Index(fields=['status', 'start_date'], name='leave_status_start_idx'),
+        ]
+
     def save(self, *args, **kwargs):
         # 휴가 일수 자동 계산 로직 (주말 제외)
         if self.start_date and self.end_date:
-            if self.leave_type in ('반차', '오전반차', '오후반차'):
-                self.days = 0.5
-            else:
-                day_count = 0
-                current_date = self.start_date
-                while current_date <= self.end_date:
-                    # 5=토요일, 6=일요일 (주말 제외)
-                    if current_date.weekday() < 5:
-                        day_count += 1
-                    current_date += timedelta(days=1)
-                self.days = float(day_count)
+            self.days = _leave_days(self.leave_type, self.start_date, self.end_date)
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -87,13 +102,21 @@ class TripRequest(models.Model):
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
     all_day = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'status', 'start_date'], name='trip_user_status_start_idx'),
+            models.Index(fields=['status', 'start_date'], name='trip_status_start_idx'),
+            models.Index(fields=['-start_date'], name='trip_start_desc_idx'),
+            models.Index(fields=['end_date'], name='trip_end_idx'),
+        ]
+
     def clean(self):
-        from django.core.exceptions import ValidationError
         if self.start_date and self.end_date and self.end_date < self.start_date:
             raise ValidationError("종료일은 시작일보다 빠를 수 없습니다.")
 
     def save(self, *args, **kwargs):
-        self.full_clean()
+        # 필드 단위 검증은 폼에서 이미 수행하므로 기간 검증만 수행
+        self.clean()
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -107,6 +130,15 @@ class TripReportRecipient(models.Model):
         return f"출장 보고 수신: {self.user.username}"
 
 
+class DefaultAdminFingerprint(models.Model):
+    """HMAC of the env password and stored hash from the last ``ensure_default_admin`` run."""
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+')
+    fingerprint = models.CharField(max_length=128)
+
+    def __str__(self):
+        return f"기본 관리자 비밀번호 지문: {self.user.username}"
+
+
 class Meeting(models.Model):
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
     participants = models.ManyToManyField(settings.AUTH_USER_MODEL, related_name='meeting_participations', blank=True)
@@ -116,7 +148,6 @@ class Meeting(models.Model):
     all_day = models.BooleanField(default=False)
 
     def clean(self):
-        from django.core.exceptions import ValidationError
         if self.start_date and self.end_date and self.end_date < self.start_date:
             raise ValidationError('종료일은 시작일보다 빠를 수 없습니다.')
 
@@ -140,7 +171,6 @@ class PersonalEvent(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     def clean(self):
-        from django.core.exceptions import ValidationError
         if self.start_date and self.end_date and self.end_date < self.start_date:
             raise ValidationError('종료일은 시작일보다 빠를 수 없습니다.')
 
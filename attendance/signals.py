@@ -1,9 +1,16 @@
 from django.conf import settings
-from django.db.models.signals import post_save, m2m_changed
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
 
-from .models import LeaveBalance
+from .caching import (
+    invalidate_approver_choices,
+    invalidate_participant_choices,
+    invalidate_trip_recipient_ids,
+    invalidate_trip_reports,
+)
+from .models import LeaveBalance, TripReportRecipient, TripRequest
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
@@ -18,7 +25,7 @@ ADMIN_GROUP_NAME = '관리자'
 def _ensure_staff_for_admin_group(user):
     # Grant staff if user is in 관리자 그룹; do not remove staff flag automatically
     try:
-        if user.groups.filter(name=ADMIN_GROUP_NAME).exists() and not user.is_staff:
+        if not user.is_staff and user.groups.filter(name=ADMIN_GROUP_NAME).exists():
             user.is_staff = True
             user.save(update_fields=['is_staff'])
     except Exception:
@@ -27,11 +34,85 @@ def _ensure_staff_for_admin_group(user):
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def ensure_staff_on_user_save(sender, instance, **kwargs):
+def ensure_staff_on_user_save(sender, instance, created, update_fields=None, **kwargs):
+    # 신규 사용자는 아직 그룹이 없고, is_staff를 건드리지 않는 저장(로그인 시각 등)은 검사 불필요
+    if created or instance.is_staff:
+        return
+    if update_fields is not None and 'is_staff' not in update_fields:
+        return
     _ensure_staff_for_admin_group(instance)
 
 
 @receiver(m2m_changed, sender=get_user_model().groups.through)
-def ensure_staff_on_group_change(sender, instance, action, **kwargs):
+def ensure_staff_on_group_change(sender, instance, action, reverse, pk_set, **kwargs):
+    # 권한 해제는 자동으로 하지 않으므로 그룹 추가 시에만 확인
+    if action != 'post_add' or not pk_set:
+        return
+    if reverse:
+        # group.user_set.add(...): instance는 Group, pk_set은 사용자 pk
+        if instance.name == ADMIN_GROUP_NAME:
+            get_user_model().objects.filter(pk__in=pk_set, is_staff=False).update(is_staff=True)
+        return
+    if not instance.is_staff and Group.objects.filter(pk__in=pk_set, name=ADMIN_GROUP_NAME).exists():
+        instance.is_staff = True
+        instance.save(update_fields=['is_staff'])
+
+
+# 결재자/동석자 선택지 캐시 무효화 (사용자명/그룹 구성 변경 시)
+@receiver(m2m_changed, sender=get_user_model().groups.through)
+def reset_approver_choices_on_group_change(sender, action, **kwargs):
     if action in {'post_add', 'post_remove', 'post_clear'}:
-        _ensure_staff_for_admin_group(instance)
+        invalidate_approver_choices()
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def reset_approver_choices(sender, **kwargs):
+    invalidate_approver_choices()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def reset_approver_choices_on_user_change(sender, created=False, update_fields=None, **kwargs):
+    # 결재자 목록은 그룹 구성으로 정해지므로 사용자 저장 중에는 이름 변경만 반영하면 된다
+    # (신규 사용자는 그룹이 없고, 로그인 시각 갱신 등은 무시)
+    if created or (update_fields is not None and 'username' not in update_fields):
+        return
+    invalidate_approver_choices()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def reset_participant_choices(sender, created=False, update_fields=None, **kwargs):
+    # 동석자 목록은 (id, 사용자명)만 담으므로 신규/삭제/이름 변경 때만 비운다
+    if not created and update_fields is not None and 'username' not in update_fields:
+        return
+    invalidate_participant_choices()
+
+
+@receiver(post_save, sender=TripReportRecipient)
+@receiver(post_delete, sender=TripReportRecipient)
+def reset_trip_recipient_ids(sender, **kwargs):
+    invalidate_trip_recipient_ids()
+
+
+# 출장 보고함 캐시 무효화 (보고서, 동석자, 작성자 이름 변경 시)
+@receiver(post_save, sender=TripRequest)
+@receiver(post_delete, sender=TripRequest)
+def reset_trip_reports(sender, **kwargs):
+    invalidate_trip_reports()
+
+
+@receiver(m2m_changed, sender=TripRequest.participants.through)
+def reset_trip_reports_on_participants_change(sender, action, **kwargs):
+    if action in {'post_add', 'post_remove', 'post_clear'}:
+        invalidate_trip_reports()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def reset_trip_reports_on_user_change(sender, update_fields=None, **kwargs):
+    # 로그인 시각 갱신처럼 이름과 무관한 저장은 무시
+    if update_fields is not None and not {'username', 'first_name', 'last_name'} & set(update_fields):
+        return
+    invalidate_trip_reports()
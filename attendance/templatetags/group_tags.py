@@ -1,5 +1,5 @@
 from django import template
-from attendance.models import TripReportRecipient
+from attendance.caching import get_group_names, get_trip_recipient_ids
 
 register = template.Library()
 
@@ -9,11 +9,11 @@ def has_group(user, group_name):
     """Return True if the user belongs to the given group name."""
     if not user or not hasattr(user, "groups"):
         return False
-    return user.groups.filter(name=group_name).exists()
+    return group_name in get_group_names(user)
 
 
 @register.filter
 def is_trip_recipient(user):
     if not user or not user.is_authenticated:
         return False
-    return TripReportRecipient.objects.filter(user=user).exists()
+    return user.id in get_trip_recipient_ids()
@@ -1,5 +1,29 @@
-from django.test import TestCase
-from .models import CustomUser, LeaveBalance, LeaveRequest, TripRequest
+import math
+import os
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from .admin import approve_leaves
+from .caching import (
+    APPROVER_CHOICES_CACHE_KEY,
+    PARTICIPANT_CHOICES_CACHE_KEY,
+    TRIP_RECIPIENT_IDS_CACHE_KEY,
+    TRIP_REPORTS_VERSION_KEY,
+    get_approver_choices,
+    get_participant_choices,
+    trip_reports_cache_key,
+)
+from .forms import LeaveForm
+from .models import CustomUser, DefaultAdminFingerprint, LeaveBalance, LeaveRequest, TripReportRecipient, TripRequest, _count_weekdays
+from .views import _bulk_used_leave, _calculate_used_leave, _current_leave_segment, _round_half_up_div
 
 class CustomUserModelTest(TestCase):
     def setUp(self):
@@ -65,4 +89,330 @@ class TripRequestModelTest(TestCase):
         )
 
     def test_trip_request_location(self):
-        self.assertEqual(self.trip_request.location, 'Seoul')
\ No newline at end of file
+        self.assertEqual(self.trip_request.location, 'Seoul')
+
+class LeaveFormApproverTest(TestCase):
+    def setUp(self):
+        self.approver = CustomUser.objects.create_user(username='approver', password='testpassword')
+        self.approver.groups.add(Group.objects.get(name='휴가 결재권자'))
+        CustomUser.objects.create_user(username='plain', password='testpassword')
+
+    def test_approver_choices_limited_to_group(self):
+        form = LeaveForm()
+        self.assertEqual(form.fields['approver1'].choices, [('', '---------'), (self.approver.id, 'approver')])
+
+    def test_approver_cleaned_to_id(self):
+        form = LeaveForm(data={
+            'leave_type': '연차',
+            'start_date': '2023-01-09',
+            'end_date': '2023-01-10',
+            'reason': 'rest',
+            'approver1': str(self.approver.id),
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['approver1'], self.approver.id)
+
+
+class CountWeekdaysTest(TestCase):
+    def test_matches_day_by_day_count(self):
+        start = date(2023, 1, 1)
+        for offset in range(30):
+            for length in range(-1, 20):
+                s = start + timedelta(days=offset)
+                e = s + timedelta(days=length)
+                expected = sum(1 for i in range((e - s).days + 1) if (s + timedelta(days=i)).weekday() < 5)
+                self.assertEqual(_count_weekdays(s, e), expected)
+
+
+class RoundHalfUpDivTest(TestCase):
+    def test_matches_float_rounding_for_year3_prorate(self):
+        for days in range(1, 367):
+            self.assertEqual(_round_half_up_div(days * 15, 365), math.floor(days / 365 * 15 + 0.5))
+
+
+class ApproveLeavesActionTest(TestCase):
+    def test_bulk_approval_deducts_balance_once_per_request(self):
+        user = CustomUser.objects.create_user(username='testuser', password='testpassword')
+        for start, end in [('2023-01-09', '2023-01-10'), ('2023-01-16', '2023-01-16')]:
+            LeaveRequest.objects.create(user=user, start_date=date.fromisoformat(start), end_date=date.fromisoformat(end), leave_type='연차', reason='r')
+        LeaveRequest.objects.create(user=user, start_date=date(2023, 1, 2), end_date=date(2023, 1, 2), leave_type='연차', reason='r', status='approved')
+
+        approve_leaves(None, None, LeaveRequest.objects.all())
+
+        self.assertFalse(LeaveRequest.objects.exclude(status='approved').exists())
+        self.assertEqual(LeaveBalance.objects.get(user=user).used_leave, 3.0)
+
+    def test_missing_days_are_computed_before_deducting(self):
+        user = CustomUser.objects.create_user(username='legacyuser', password='testpassword')
+        full = LeaveRequest.objects.create(user=user, start_date=date(2023, 1, 6), end_date=date(2023, 1, 9), leave_type='연차', reason='r')
+        half = LeaveRequest.objects.create(user=user, start_date=date(2023, 1, 11), end_date=date(2023, 1, 11), leave_type='오전반차', reason='r')
+        # days 컬럼 추가 이전에 만들어진 신청처럼 값을 비운다
+        LeaveRequest.objects.filter(pk__in=[full.pk, half.pk]).update(days=None)
+
+        approve_leaves(None, None, LeaveRequest.objects.all())
+
+        self.assertEqual(LeaveBalance.objects.get(user=user).used_leave, 2.5)
+        full.refresh_from_db()
+        half.refresh_from_db()
+        self.assertEqual((full.days, half.days), (2.0, 0.5))
+
+
+class AdminGroupStaffSignalTest(TestCase):
+    def setUp(self):
+        self.admin_group = Group.objects.get(name='관리자')
+        self.other_group = Group.objects.get(name='경영관리부')
+
+    def test_staff_granted_when_added_to_admin_group(self):
+        user = CustomUser.objects.create_user(username='u1', password='testpassword')
+        user.groups.add(self.other_group)
+        self.assertFalse(CustomUser.objects.get(pk=user.pk).is_staff)
+        user.groups.add(self.admin_group)
+        self.assertTrue(CustomUser.objects.get(pk=user.pk).is_staff)
+
+    def test_staff_granted_via_reverse_add(self):
+        user = CustomUser.objects.create_user(username='u2', password='testpassword')
+        self.admin_group.user_set.add(user)
+        self.assertTrue(CustomUser.objects.get(pk=user.pk).is_staff)
+
+
+class CalendarEventsApiTest(TestCase):
+    def test_returns_events_within_requested_range(self):
+        user = CustomUser.objects.create_user(username='caluser', password='pw')
+        LeaveRequest.objects.create(user=user, start_date=date(2024, 3, 4), end_date=date(2024, 3, 5), leave_type='연차', status='approved')
+        LeaveRequest.objects.create(user=user, start_date=date(2024, 6, 3), end_date=date(2024, 6, 3), leave_type='연차', status='approved')
+        self.client.login(username='caluser', password='pw')
+        response = self.client.get('/attendance/calendar/events/', {'start': '2024-03-01T00:00:00+09:00', 'end': '2024-04-01T00:00:00+09:00'})
+        self.assertEqual(response.status_code, 200)
+        events = response.json()
+        self.assertEqual([e['start'] for e in events], ['2024-03-04'])
+        self.assertEqual(events[0]['end'], '2024-03-06')
+
+    def test_extreme_range_falls_back_to_default_window(self):
+        user = CustomUser.objects.create_user(username='extremeuser', password='pw')
+        today = timezone.localdate()
+        LeaveRequest.objects.create(user=user, start_date=today, end_date=today, leave_type='연차', status='approved')
+        self.client.login(username='extremeuser', password='pw')
+        for params in (
+            {'start': '0001-01-01', 'end': '0001-02-01'},
+            {'start': '0001-01-01T00:00:00Z', 'end': '0001-01-01T12:00:00Z'},
+        ):
+            response = self.client.get('/attendance/calendar/events/', params)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual([e['start'] for e in response.json()], [today.isoformat()])
+
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class DateFilterBoundsTest(TestCase):
+    def setUp(self):
+        user = CustomUser.objects.create_user(username='boundsadmin', password='pw')
+        user.groups.add(Group.objects.get(name='관리자'))
+        now = timezone.now()
+        TripRequest.objects.create(user=user, start_date=now, end_date=now, location='Daejeon', purpose='p', report_content='r', status='approved')
+        self.client.login(username='boundsadmin', password='pw')
+
+    def test_extreme_dates_leave_filter_unbounded(self):
+        cases = [
+            ('/attendance/management/external-events/', {'start_to': '9999-12-31'}),
+            ('/attendance/management/external-events/', {'start_from': '0001-01-01'}),
+            ('/attendance/reports/trip/', {'start_date': '0001-01-01'}),
+            ('/attendance/reports/trip/', {'end_date': '9999-12-31'}),
+        ]
+        for url, params in cases:
+            self.assertContains(self.client.get(url, params), 'Daejeon')
+
+    def test_day_bounds_are_inclusive(self):
+        today = timezone.localdate()
+        tomorrow = (today + timedelta(days=1)).isoformat()
+        self.assertContains(self.client.get('/attendance/reports/trip/', {'start_date': today.isoformat(), 'end_date': today.isoformat()}), 'Daejeon')
+        self.assertNotContains(self.client.get('/attendance/reports/trip/', {'start_date': tomorrow}), 'Daejeon')
+
+
+class ApproverChoicesCacheTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='cacheuser', password='pw')
+        get_approver_choices()
+
+    def test_login_keeps_cached_choices(self):
+        self.client.login(username='cacheuser', password='pw')
+        self.assertIsNotNone(cache.get(APPROVER_CHOICES_CACHE_KEY))
+
+    def test_username_change_clears_cached_choices(self):
+        self.user.username = 'renamed'
+        self.user.save(update_fields=['username'])
+        self.assertIsNone(cache.get(APPROVER_CHOICES_CACHE_KEY))
+
+
+class ParticipantChoicesCacheTest(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username='participant', password='pw')
+        get_participant_choices()
+
+    def test_login_keeps_cached_choices(self):
+        self.client.login(username='participant', password='pw')
+        self.assertIsNotNone(cache.get(PARTICIPANT_CHOICES_CACHE_KEY))
+
+    def test_new_user_clears_cached_choices(self):
+        CustomUser.objects.create_user(username='newcomer', password='pw')
+        self.assertIsNone(cache.get(PARTICIPANT_CHOICES_CACHE_KEY))
+
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class TripReportInboxAccessTest(TestCase):
+    def test_stale_recipient_cache_does_not_grant_access(self):
+        user = CustomUser.objects.create_user(username='formerrecipient', password='pw')
+        # 다른 워커에 남아 있는 수신자 캐시를 흉내낸다
+        cache.set(TRIP_RECIPIENT_IDS_CACHE_KEY, frozenset([user.id]))
+        self.client.login(username='formerrecipient', password='pw')
+        self.assertEqual(self.client.get('/attendance/reports/trip/').status_code, 403)
+        cache.delete(TRIP_RECIPIENT_IDS_CACHE_KEY)
+
+    def test_recipient_has_access(self):
+        user = CustomUser.objects.create_user(username='recipient', password='pw')
+        TripReportRecipient.objects.create(user=user)
+        self.client.login(username='recipient', password='pw')
+        self.assertEqual(self.client.get('/attendance/reports/trip/').status_code, 200)
+
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class TripReportInboxCacheTest(TestCase):
+    url = '/attendance/reports/trip/'
+
+    def setUp(self):
+        cache.delete(TRIP_REPORTS_VERSION_KEY)
+        self.user = CustomUser.objects.create_user(username='inboxreader', password='pw')
+        TripReportRecipient.objects.create(user=self.user)
+        now = timezone.now()
+        self.trip = TripRequest.objects.create(
+            user=self.user, start_date=now, end_date=now, location='부산', purpose='출장', report_content='첫 보고',
+        )
+        self.client.login(username='inboxreader', password='pw')
+
+    def _trip_queries(self, params=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, params)
+        return response, [q['sql'] for q in ctx.captured_queries if 'attendance_triprequest' in q['sql']]
+
+    def test_cache_hit_skips_trip_queries(self):
+        response, queries = self._trip_queries()
+        self.assertTrue(queries)
+        self.assertContains(response, '첫 보고')
+        response, queries = self._trip_queries()
+        self.assertEqual(queries, [])
+        self.assertContains(response, '첫 보고')
+
+    def test_cache_key_parts_are_unambiguous(self):
+        self.assertNotEqual(
+            trip_reports_cache_key('x|2024-01-01', '', '', ''),
+            trip_reports_cache_key('x', '2024-01-01', '', '|'),
+        )
+
+    def test_page_variants_share_resolved_page_entry(self):
+        self.client.get(self.url)
+        for page in ('1', '01', 'abc', '999'):
+            response, queries = self._trip_queries({'page': page})
+            self.assertEqual(queries, [], page)
+            self.assertEqual(response.context['page_obj'].number, 1)
+
+    def test_pagination_links_encode_date_filters(self):
+        now = timezone.now()
+        for i in range(20):
+            TripRequest.objects.create(user=self.user, start_date=now, end_date=now, location=f'L{i}', purpose='p', report_content='r')
+        response = self.client.get(self.url, {'start_date': 'x&page=9#', 'end_date': 'y&q=z'})
+        self.assertContains(response, '&start_date=x%26page%3D9%23&end_date=y%26q%3Dz')
+
+    def test_cached_rows_defer_user_password(self):
+        response = self.client.get(self.url)
+        trip = response.context['reports'].object_list[0]
+        self.assertIn('password', trip.user.get_deferred_fields())
+
+    def test_trip_save_bumps_version(self):
+        self.client.get(self.url)
+        version = cache.get(TRIP_REPORTS_VERSION_KEY)
+        self.trip.report_content = '수정된 보고'
+        self.trip.save()
+        self.assertIsNone(cache.get(TRIP_REPORTS_VERSION_KEY))
+        response = self.client.get(self.url)
+        self.assertContains(response, '수정된 보고')
+        self.assertNotEqual(cache.get(TRIP_REPORTS_VERSION_KEY), version)
+
+
+class BulkUsedLeaveTest(TestCase):
+    def test_matches_per_user_calculation(self):
+        today = date(2024, 6, 14)
+        join_dates = {
+            'veteran': date(2018, 3, 10),     # 1주년 이후 (회계연도 구간)
+            'second_year': date(2023, 4, 1),  # 올해 1주년 (부분 구간)
+            'newcomer': date(2024, 2, 1),     # 입사 첫 해
+            'no_join_date': None,
+            'future_hire': date(2024, 7, 1),
+        }
+        users = []
+        for username, join_date in join_dates.items():
+            user = CustomUser.objects.create_user(username=username, password='pw', join_date=join_date)
+            users.append(user)
+            for start, end, status in (
+                (date(2022, 11, 7), date(2022, 11, 8), 'approved'),
+                (date(2023, 12, 26), date(2023, 12, 27), 'approved'),
+                (date(2024, 1, 8), date(2024, 1, 8), 'approved'),
+                (date(2024, 3, 4), date(2024, 3, 6), 'approved'),
+                (date(2024, 5, 13), date(2024, 5, 13), 'pending'),
+                (date(2024, 8, 5), date(2024, 8, 5), 'approved'),
+            ):
+                LeaveRequest.objects.create(user=user, start_date=start, end_date=end, leave_type='연차', reason='r', status=status)
+
+        bulk = _bulk_used_leave(users, today)
+        for user in users:
+            expected = _calculate_used_leave(user, _current_leave_segment(user.join_date, today))
+            self.assertEqual(bulk.get(user.id, 0.0), expected, user.username)
+        # 구간이 서로 달라 사용일수도 달라야 의미 있는 비교가 된다
+        self.assertEqual(len({bulk.get(u.id, 0.0) for u in users[:3]}), 3)
+        self.assertNotIn(users[3].id, bulk)
+
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class TripRequestAdminTest(TestCase):
+    def setUp(self):
+        self.admin_user = CustomUser.objects.create_superuser(username='tripadmin', password='pw')
+        now = timezone.now()
+        self.trip = TripRequest.objects.create(
+            user=self.admin_user, start_date=now, end_date=now, location='Ulsan', purpose='목적' * 20, report_content='보고' * 30,
+        )
+        self.client.login(username='tripadmin', password='pw')
+
+    def test_changelist_shows_truncated_text(self):
+        response = self.client.get('/admin/attendance/triprequest/')
+        self.assertContains(response, '목적' * 10 + '...')
+
+    def test_change_form_loads_full_text(self):
+        response = self.client.get(f'/admin/attendance/triprequest/{self.trip.pk}/change/')
+        self.assertContains(response, '보고' * 30)
+        self.assertNotIn('report_content', response.context['original'].get_deferred_fields())
+
+
+class EnsureDefaultAdminTest(TestCase):
+    env = {'DEFAULT_ADMIN_USERNAME': 'bootadmin', 'DEFAULT_ADMIN_PASSWORD': 'first-pw'}
+
+    def _run(self, **env):
+        with mock.patch.dict(os.environ, {**self.env, **env}):
+            call_command('ensure_default_admin', stdout=StringIO())
+
+    def test_unchanged_password_skips_check(self):
+        self._run()
+        with mock.patch.object(CustomUser, 'check_password') as check:
+            self._run()
+        check.assert_not_called()
+        self.assertTrue(CustomUser.objects.get(username='bootadmin').check_password('first-pw'))
+
+    def test_changed_password_is_applied(self):
+        self._run()
+        self._run(DEFAULT_ADMIN_PASSWORD='second-pw')
+        user = CustomUser.objects.get(username='bootadmin')
+        self.assertTrue(user.check_password('second-pw'))
+        self.assertEqual(DefaultAdminFingerprint.objects.filter(user=user).count(), 1)
+
+    def test_missing_fingerprint_falls_back_to_check(self):
+        self._run()
+        DefaultAdminFingerprint.objects.all().delete()
+        with mock.patch.object(CustomUser, 'check_password', return_value=True) as check:
+            self._run()
+        check.assert_called_once_with('first-pw')
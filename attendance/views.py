@@ -1,22 +1,26 @@
 import json
-import math
 import secrets
 import uuid
-from datetime import timedelta, date, datetime
+from collections import defaultdict
+from datetime import timedelta, date, datetime, time, timezone as dt_timezone
+from functools import lru_cache, wraps
+from types import MappingProxyType
 
-from django.db import models
+from django.db import models, transaction
 
 from django.conf import settings
-from django.db.models import Q, Sum
+from django.db.models import Prefetch, Q, Sum
 
 from django.contrib import messages
 from django.contrib.auth import get_user_model, login
 from django.contrib.auth.decorators import login_required
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.core.mail import send_mail
 from django.core.paginator import Paginator
 from django.utils.crypto import get_random_string
-from django.http import HttpResponseForbidden, HttpResponse, JsonResponse
+from django.http import Http404, HttpResponseForbidden, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
 from django.urls import reverse
@@ -24,29 +28,99 @@ from django.views.decorators.http import require_POST
 
 from .forms import LeaveForm, SignUpForm, TripForm, TripReportForm, MeetingForm, PersonalEventForm
 from .models import LeaveApprovalStep, LeaveBalance, LeaveRequest, TripReportRecipient, TripRequest, Meeting, PersonalEvent, CustomUser
+from .caching import TRIP_REPORTS_CACHE_TTL, get_group_names, invalidate_trip_recipient_ids, trip_reports_cache_key
 
 ADMIN_GROUP = '관리자'
 ROLE_GROUPS = ['관리자', '휴가 결재권자', '출장 결재권자', '경영관리부', '외부일정 보고 수신자']
+ROLE_GROUPS_SET = frozenset(ROLE_GROUPS)
+
+# 캘린더 조회 구간이 주어지지 않았을 때의 기본 일정 범위 (오늘 기준)
+CALENDAR_WINDOW_PAST_DAYS = 60
+CALENDAR_WINDOW_FUTURE_DAYS = 180
+
+# 종일 일정의 종료 시각 (초 단위까지)
+_ALL_DAY_END_TIME = time(23, 59, 59)
 
 
 def _user_in_groups(user, group_names):
-    return user.is_authenticated and user.groups.filter(name__in=group_names).exists()
+    return user.is_authenticated and not get_group_names(user).isdisjoint(group_names)
+
+
+def require_groups(*group_names, message='권한이 필요합니다.'):
+    """View decorator returning 403 unless the user belongs to one of ``group_names``."""
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped(request, *args, **kwargs):
+            if not _user_in_groups(request.user, group_names):
+                return HttpResponseForbidden(message)
+            return view_func(request, *args, **kwargs)
+        return _wrapped
+    return decorator
 
 
 def _is_trip_recipient(user):
     if not user or not user.is_authenticated:
         return False
-    return TripReportRecipient.objects.filter(user=user).exists()
+    # 접근 권한 검사이므로 워커별 캐시가 아닌 DB로 확인하고, 한 요청 안에서만 사용자 객체에 보관
+    cached = getattr(user, '_is_trip_recipient_cache', None)
+    if cached is None:
+        cached = TripReportRecipient.objects.filter(user_id=user.id).exists()
+        user._is_trip_recipient_cache = cached
+    return cached
 
 
 def _normalize_all_day_event(event_obj):
     """Ensure all-day events span full local days and times are aligned."""
     if getattr(event_obj, 'all_day', False) and event_obj.start_date and event_obj.end_date:
+        start_local = timezone.localtime(event_obj.start_date)
+        end_local = timezone.localtime(event_obj.end_date)
+        # 이미 00:00:00 ~ 23:59:59로 맞춰진 경우(수정 화면 재저장 등)는 다시 만들지 않는다
+        if start_local.time() == time.min and end_local.time() == _ALL_DAY_END_TIME:
+            return
         tz = timezone.get_current_timezone()
-        start_date = timezone.localdate(event_obj.start_date)
-        end_date = timezone.localdate(event_obj.end_date)
-        event_obj.start_date = timezone.make_aware(timezone.datetime.combine(start_date, timezone.datetime.min.time()), tz)
-        event_obj.end_date = timezone.make_aware(timezone.datetime.combine(end_date, timezone.datetime.max.time().replace(microsecond=0)), tz)
+        event_obj.start_date = timezone.make_aware(datetime.combine(start_local.date(), time.min), tz)
+        event_obj.end_date = timezone.make_aware(datetime.combine(end_local.date(), _ALL_DAY_END_TIME), tz)
+
+
+def _event_time_label(start_dt, end_dt, all_day: bool) -> str:
+    """Short 'MM-DD HH:MM ~ MM-DD HH:MM' label used by the weekly highlights."""
+    start_md = start_dt.strftime('%m-%d')
+    if all_day:
+        return f"{start_md} 종일"
+    return f"{start_md} {start_dt.strftime('%H:%M')} ~ {end_dt.strftime('%m-%d %H:%M')}"
+
+
+def _local_date_bounds(start_day=None, end_day=None):
+    """Aware ``[start, end)`` bounds covering the local dates start_day..end_day inclusive.
+
+    Either day may be None. A bound that cannot be represented (near date.min/date.max)
+    comes back as None, i.e. that side is left unbounded.
+    """
+    tz = timezone.get_current_timezone()
+
+    def _midnight(day):
+        try:
+            dt = timezone.make_aware(datetime.combine(day, time.min), tz)
+            # DB에는 UTC로 저장되므로 UTC로 변환 가능한지까지 확인
+            dt.astimezone(dt_timezone.utc)
+        except OverflowError:
+            return None
+        return dt
+
+    start = _midnight(start_day) if start_day else None
+    end = _midnight(end_day + timedelta(days=1)) if end_day and end_day < date.max else None
+    return start, end
+
+
+def _fmt_ampm(dt) -> str:
+    """Same output as strftime('%Y-%m-%d %p %I:%M') in the C locale, without strftime."""
+    hour = dt.hour
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {'PM' if hour >= 12 else 'AM'} {(hour - 1) % 12 + 1:02d}:{dt.minute:02d}"
+
+
+def _url_template(name: str) -> str:
+    """Reverse a URL that takes a single int id once, returning a str.format() template."""
+    return reverse(name, args=[0]).replace('/0/', '/{}/')
 
 
 def _ensure_feed_token(user: CustomUser) -> str:
@@ -80,12 +154,13 @@ def _parse_iso_datetime(dt_str: str):
             dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
         else:
             dt = datetime.fromisoformat(dt_str)
-    except ValueError:
+        if timezone.is_naive(dt):
+            dt = timezone.make_aware(dt, timezone=timezone.get_current_timezone())
+        else:
+            dt = dt.astimezone(timezone.get_current_timezone())
+    except (ValueError, OverflowError):
+        # 0001-01-01T00:00:00Z 같은 극단값은 현지 시각으로 변환할 수 없다
         return None
-    if timezone.is_naive(dt):
-        dt = timezone.make_aware(dt, timezone=timezone.get_current_timezone())
-    else:
-        dt = dt.astimezone(timezone.get_current_timezone())
     return dt
 
 
@@ -100,10 +175,12 @@ def _parse_event_datetimes(start_str: str, end_str: str, all_day: bool):
     return start_dt, end_dt
 
 
-def _round_half_up(value: float) -> int:
-    return math.floor(value + 0.5)
+def _round_half_up_div(numerator: int, denominator: int) -> int:
+    # 음수가 아닌 정수 나눗셈의 반올림 (부동소수점 없이)
+    return (numerator * 2 + denominator) // (denominator * 2)
 
 
+@lru_cache(maxsize=4096)
 def _last_day_of_month(year: int, month: int) -> int:
     if month == 12:
         return 31
@@ -153,8 +230,14 @@ def _service_year_end(join_date: date, service_year: int) -> date:
     return date(end_year, end_month, _last_day_of_month(end_year, end_month))
 
 
+@lru_cache(maxsize=4096)
 def _current_leave_segment(join_date: date, today: date):
-    """Return current leave segment info based on hire date."""
+    """Return current leave segment info based on hire date.
+
+    Memoized on (join_date, today); the returned mapping is read-only because
+    it is shared between callers. Use ``_current_leave_segment.cache_clear()``
+    to reset it in tests.
+    """
     if not join_date or join_date > today:
         return None
 
@@ -162,12 +245,12 @@ def _current_leave_segment(join_date: date, today: date):
     first_year_end = date(join_date.year, 12, 31)
 
     if today.year == join_date.year:
-        return {
+        return MappingProxyType({
             'type': 'year1_calendar_monthly_skip_join_month',
             'start': join_date,
             'end': first_year_end,
             'join_month': join_date.month,
-        }
+        })
 
     # 이후 로직은 기존 흐름 유지: 1주년 기준 분기
     first_anniv = join_date.replace(year=join_date.year + 1)
@@ -176,31 +259,31 @@ def _current_leave_segment(join_date: date, today: date):
 
     # Year 2 (partial): from anniversary to Dec 31 of anniversary year
     if today.year == first_anniv.year:
-        return {
+        return MappingProxyType({
             'type': 'year2_partial_monthly',
             'start': first_anniv,
             'end': date(first_anniv.year, 12, 31),
             'start_month': first_anniv.month,
-        }
+        })
 
     # Year 3 (first full calendar year after anniversary): prorated calendar year with rounding
     if today.year == first_anniv.year + 1:
-        return {
+        return MappingProxyType({
             'type': 'year3_prorated_calendar',
             'start': date(today.year, 1, 1),
             'end': date(today.year, 12, 31),
             'round_half_up': True,
-        }
+        })
 
     # Year 4+ : calendar-year annual grant (15 + (service_year-3))
     service_year = (today.year - join_date.year) + 1
-    return {
+    return MappingProxyType({
         'type': 'annual',
         'start': date(today.year, 1, 1),
         'end': date(today.year, 12, 31),
         'annual_days': 15 + (service_year - 3),
         'round_half_up': False,
-    }
+    })
 
 
 def _calculate_earned_leave(join_date: date, today: date, segment=None) -> int:
@@ -227,8 +310,8 @@ def _calculate_earned_leave(join_date: date, today: date, segment=None) -> int:
 
     if seg_type == 'year3_prorated_calendar':
         days_employed = (today - seg['start']).days + 1
-        accrued = (days_employed / 365) * 15
-        return _round_half_up(accrued) if seg.get('round_half_up') else math.floor(accrued)
+        accrued = days_employed * 15
+        return _round_half_up_div(accrued, 365) if seg.get('round_half_up') else accrued // 365
 
     if seg_type == 'annual':
         if today < seg['start']:
@@ -251,12 +334,8 @@ def _calculate_used_leave(user, segment) -> float:
     )
 
 
-def _leave_summary_for_user(user) -> dict:
-    today = timezone.localdate()
-    join_dt = getattr(user, 'join_date', None)
-    segment = _current_leave_segment(join_dt, today)
+def _build_leave_summary(join_dt, segment, today, used) -> dict:
     earned = _calculate_earned_leave(join_dt, today, segment) if segment else 0
-    used = _calculate_used_leave(user, segment)
     remaining = earned - used
     usage_rate = (used / earned * 100) if earned > 0 else 0
     reset_date = segment['end'] if segment else None
@@ -271,6 +350,40 @@ def _leave_summary_for_user(user) -> dict:
     }
 
 
+def _bulk_used_leave(users, today) -> dict:
+    """Approved leave days per user within each user's current segment, in one query."""
+    # 대부분의 사용자가 같은 구간(올해 1/1~12/31)을 공유하므로 구간별로 묶어 조건을 만든다
+    ids_by_window = {}
+    for u in users:
+        segment = _current_leave_segment(getattr(u, 'join_date', None), today)
+        if segment:
+            ids_by_window.setdefault((segment['start'], segment['end']), []).append(u.id)
+    if not ids_by_window:
+        return {}
+
+    window_q = Q()
+    for (start, end), user_ids in ids_by_window.items():
+        window_q |= Q(user_id__in=user_ids, start_date__gte=start, start_date__lte=end)
+    rows = (
+        LeaveRequest.objects.filter(status='approved').filter(window_q)
+        .exclude(days__isnull=True)
+        .values('user_id')
+        .annotate(used=Sum('days'))
+    )
+    return {row['user_id']: float(row['used'] or 0) for row in rows}
+
+
+def _leave_summary_for_user(user, used_override=None) -> dict:
+    today = timezone.localdate()
+    join_dt = getattr(user, 'join_date', None)
+    segment = _current_leave_segment(join_dt, today)
+    if used_override is None:
+        used = _calculate_used_leave(user, segment)
+    else:
+        used = used_override if segment else 0.0
+    return _build_leave_summary(join_dt, segment, today, used)
+
+
 def signup(request):
     if request.method == 'POST':
         form = SignUpForm(request.POST)
@@ -326,204 +439,259 @@ def password_reset_request(request):
     return render(request, 'registration/password_reset.html')
 
 
-@login_required
-def dashboard(request):
-    leave_balance = LeaveBalance.objects.filter(user=request.user).first()
-    if not leave_balance:
-        leave_balance = LeaveBalance(user=request.user, total_leave=15, used_leave=0)
+def _weekly_highlights(user, today: date, week_end: date) -> dict:
+    """Collect the user's own events overlapping [today, week_end], each list ordered by start."""
+    week_start_dt, week_end_dt = _local_date_bounds(today, week_end)
+    highlights = {'leave': [], 'trip': [], 'meeting': [], 'personal': []}
 
-    leave_summary = _leave_summary_for_user(request.user)
-    today = timezone.localdate()
-    week_end = today + timedelta(days=6)
-    weekly_highlights = {'leave': [], 'trip': [], 'meeting': [], 'personal': []}
+    leaves = LeaveRequest.objects.filter(
+        user=user, status='approved', start_date__lte=week_end, end_date__gte=today,
+    ).only('leave_type', 'start_date', 'end_date').order_by('start_date', 'id')
+    for leave in leaves:
+        highlights['leave'].append({
+            'title': leave.leave_type,
+            'detail': f"{leave.start_date.strftime('%m-%d')} ~ {leave.end_date.strftime('%m-%d')}",
+            'order': leave.start_date,
+        })
 
-    my_leaves = LeaveRequest.objects.filter(user=request.user).order_by('-start_date')
-    my_trips = TripRequest.objects.filter(
-        Q(user=request.user) | Q(participants=request.user)
-    ).distinct().order_by('-start_date')
-    pending_trip_reports = TripRequest.objects.filter(
-        user=request.user,
-        status='approved'
-    ).filter(Q(report_content__isnull=True) | Q(report_content='')).count()
+    mine_or_joined = Q(user=user) | Q(participants=user)
+    trips = TripRequest.objects.filter(
+        mine_or_joined, status='approved', start_date__lt=week_end_dt, end_date__gte=week_start_dt,
+    ).distinct().only('location', 'purpose', 'start_date', 'end_date', 'all_day').order_by('start_date', 'id')
+    for trip in trips:
+        start_dt = timezone.localtime(trip.start_date)
+        highlights['trip'].append({
+            'title': trip.location or trip.purpose,
+            'detail': _event_time_label(start_dt, timezone.localtime(trip.end_date), trip.all_day),
+            'order': start_dt,
+        })
 
-    calendar_events = []
+    meetings = Meeting.objects.filter(
+        mine_or_joined, start_date__lt=week_end_dt, end_date__gte=week_start_dt,
+    ).distinct().only('subject', 'start_date', 'end_date', 'all_day').order_by('start_date', 'id')
+    for meeting in meetings:
+        start_dt = timezone.localtime(meeting.start_date)
+        highlights['meeting'].append({
+            'title': meeting.subject,
+            'detail': _event_time_label(start_dt, timezone.localtime(meeting.end_date), meeting.all_day),
+            'order': start_dt,
+        })
 
-    leave_qs = LeaveRequest.objects.filter(status='approved').select_related('user')
-    for leave in leave_qs:
-        mine = leave.user_id == request.user.id
+    personals = PersonalEvent.objects.filter(
+        user=user, start_date__lt=week_end_dt, end_date__gte=week_start_dt,
+    ).only('title', 'location', 'start_date', 'end_date', 'all_day').order_by('start_date', 'id')
+    for p in personals:
+        start_dt = timezone.localtime(p.start_date)
+        location_label = p.location or '장소 미정'
+        highlights['personal'].append({
+            'title': p.title,
+            'detail': f"{location_label} · {_event_time_label(start_dt, timezone.localtime(p.end_date), p.all_day)}",
+            'order': start_dt,
+        })
+
+    return highlights
+
+
+def _participants_by_event(related_name, event_ids) -> tuple:
+    """Participant usernames and ids per event id, from a single query on the M2M join."""
+    names = defaultdict(list)
+    participant_ids = defaultdict(set)
+    rows = get_user_model().objects.filter(**{f'{related_name}__in': event_ids}).values_list(related_name, 'id', 'username')
+    for event_id, user_id, username in rows:
+        names[event_id].append(username)
+        participant_ids[event_id].add(user_id)
+    return names, participant_ids
+
+
+def _calendar_events_for_user(user, window_start, window_end) -> list:
+    """FullCalendar event dicts for the given inclusive date window."""
+    uid = user.id
+    calendar_events = []
+    # URL 리졸버는 이벤트마다가 아니라 이름마다 한 번만 호출
+    url_templates = {name: _url_template(name) for name in (
+        'leave_delete', 'trip_update', 'trip_delete', 'meeting_update', 'meeting_delete', 'personal_update', 'personal_delete',
+    )}
+
+    # 구간 끝은 다음날 자정 (배타적) — 호출하는 쪽에서 표현 가능한 날짜로 맞춰 둔다
+    window_start_dt, window_end_dt = _local_date_bounds(window_start, window_end)
+
+    # 모델 인스턴스 없이 필요한 컬럼만 dict로 받아 직렬화
+    leave_rows = LeaveRequest.objects.filter(
+        status='approved', end_date__gte=window_start, start_date__lte=window_end,
+    ).values('id', 'leave_type', 'reason', 'start_date', 'end_date', 'user_id', 'user__username')
+    for leave in leave_rows:
+        mine = leave['user_id'] == uid
         color = '#4c6ef5' if mine else '#adb5bd'
-        if mine and leave.start_date <= week_end and leave.end_date >= today:
-            weekly_highlights['leave'].append({
-                'title': leave.leave_type,
-                'detail': f"{leave.start_date.strftime('%m-%d')} ~ {leave.end_date.strftime('%m-%d')}",
-                'order': leave.start_date,
-            })
         calendar_events.append({
-            'title': leave.reason if leave.reason else leave.leave_type,
-            'start': leave.start_date.isoformat(),
-            'end': (leave.end_date + timedelta(days=1)).isoformat(),
+            'title': leave['reason'] if leave['reason'] else leave['leave_type'],
+            'start': leave['start_date'].isoformat(),
+            'end': (leave['end_date'] + timedelta(days=1)).isoformat(),
             'allDay': True,
             'backgroundColor': color,
             'borderColor': color,
             'editable': False,
             'extendedProps': {
                 'type': 'leave',
-                'id': leave.id,
-                'user': leave.user.username,
-                'range': f"{leave.start_date} ~ {leave.end_date}",
-                'reason': leave.reason,
+                'id': leave['id'],
+                'user': leave['user__username'],
+                'range': f"{leave['start_date']} ~ {leave['end_date']}",
+                'reason': leave['reason'],
                 'mine': mine,
-                'title': leave.leave_type,
+                'title': leave['leave_type'],
                 'canManage': mine,
-                'deleteUrl': reverse('leave_delete', args=[leave.id]) if mine else '',
+                'deleteUrl': url_templates['leave_delete'].format(leave['id']) if mine else '',
             },
         })
 
-    trip_qs = TripRequest.objects.filter(status='approved').select_related('user')
-    trip_qs = trip_qs.prefetch_related('participants')
-    for trip in trip_qs:
-        owner = trip.user_id == request.user.id
-        participant_ids = [p.id for p in trip.participants.all()]
-        is_participant = request.user.id in participant_ids
-        mine_for_color = owner or is_participant
+    trip_rows = list(TripRequest.objects.filter(
+        status='approved', end_date__gte=window_start_dt, start_date__lt=window_end_dt,
+    ).values('id', 'location', 'purpose', 'start_date', 'end_date', 'all_day', 'user_id', 'user__username'))
+    trip_participants, trip_participant_ids = _participants_by_event('trip_participations', [t['id'] for t in trip_rows])
+    for trip in trip_rows:
+        trip_id = trip['id']
+        owner = trip['user_id'] == uid
+        mine_for_color = owner or uid in trip_participant_ids[trip_id]
         color = '#0dcaf0' if mine_for_color else '#adb5bd'
-        is_all_day = getattr(trip, 'all_day', False)
-        start_dt = timezone.localtime(trip.start_date)
-        end_dt = timezone.localtime(trip.end_date)
-        participant_names = [p.username for p in trip.participants.all()]
-        if mine_for_color and start_dt.date() <= week_end and end_dt.date() >= today:
-            weekly_highlights['trip'].append({
-                'title': trip.location or trip.purpose,
-                'detail': f"{start_dt.strftime('%m-%d')}" + (" 종일" if is_all_day else f" {start_dt.strftime('%H:%M')}") + (f" ~ {end_dt.strftime('%m-%d %H:%M')}" if not is_all_day else ''),
-                'order': start_dt,
-            })
+        is_all_day = trip['all_day']
+        start_dt = timezone.localtime(trip['start_date'])
+        end_dt = timezone.localtime(trip['end_date'])
+        start_day, end_day = start_dt.date(), end_dt.date()
         calendar_events.append({
-            'title': trip.location,
-            'start': start_dt.date().isoformat() if is_all_day else start_dt.isoformat(),
-            'end': (end_dt.date() + timedelta(days=1)).isoformat() if is_all_day else end_dt.isoformat(),
+            'title': trip['location'],
+            'start': start_day.isoformat() if is_all_day else start_dt.isoformat(),
+            'end': (end_day + timedelta(days=1)).isoformat() if is_all_day else end_dt.isoformat(),
             'allDay': is_all_day,
             'backgroundColor': color,
             'borderColor': color,
             'extendedProps': {
                 'type': 'trip',
-                'id': trip.id,
-                'user': trip.user.username,
-                'range': f"{start_dt.strftime('%Y-%m-%d %p %I:%M')} ~ {end_dt.strftime('%Y-%m-%d %p %I:%M')}",
-                'location': trip.location,
-                'purpose': trip.purpose,
+                'id': trip_id,
+                'user': trip['user__username'],
+                'range': f"{_fmt_ampm(start_dt)} ~ {_fmt_ampm(end_dt)}",
+                'location': trip['location'],
+                'purpose': trip['purpose'],
                 'mine': mine_for_color,
-                'title': trip.purpose,
+                'title': trip['purpose'],
                 'canManage': owner,
-                'editUrl': reverse('trip_update', args=[trip.id]) if owner else '',
-                'deleteUrl': reverse('trip_delete', args=[trip.id]) if owner else '',
-                'participants': participant_names,
+                'editUrl': url_templates['trip_update'].format(trip_id) if owner else '',
+                'deleteUrl': url_templates['trip_delete'].format(trip_id) if owner else '',
+                'participants': trip_participants[trip_id],
             },
             'editable': owner,
         })
 
-    meeting_qs = Meeting.objects.select_related('user').prefetch_related('participants')
-    for meeting in meeting_qs:
-        owner = meeting.user_id == request.user.id
-        participant_ids = [p.id for p in meeting.participants.all()]
-        is_participant = request.user.id in participant_ids
-        mine_for_color = owner or is_participant
+    meeting_rows = list(Meeting.objects.filter(
+        end_date__gte=window_start_dt, start_date__lt=window_end_dt,
+    ).values('id', 'subject', 'start_date', 'end_date', 'all_day', 'user_id', 'user__username'))
+    meeting_participants, meeting_participant_ids = _participants_by_event('meeting_participations', [m['id'] for m in meeting_rows])
+    for meeting in meeting_rows:
+        meeting_id = meeting['id']
+        owner = meeting['user_id'] == uid
+        mine_for_color = owner or uid in meeting_participant_ids[meeting_id]
         color = '#20c997' if mine_for_color else '#adb5bd'
-        is_all_day = getattr(meeting, 'all_day', False)
-        start_dt = timezone.localtime(meeting.start_date)
-        end_dt = timezone.localtime(meeting.end_date)
-        participant_names = [p.username for p in meeting.participants.all()]
-        if mine_for_color and start_dt.date() <= week_end and end_dt.date() >= today:
-            weekly_highlights['meeting'].append({
-                'title': meeting.subject,
-                'detail': f"{start_dt.strftime('%m-%d')}" + (" 종일" if is_all_day else f" {start_dt.strftime('%H:%M')}") + (f" ~ {end_dt.strftime('%m-%d %H:%M')}" if not is_all_day else ''),
-                'order': start_dt,
-            })
+        is_all_day = meeting['all_day']
+        start_dt = timezone.localtime(meeting['start_date'])
+        end_dt = timezone.localtime(meeting['end_date'])
+        start_day, end_day = start_dt.date(), end_dt.date()
         calendar_events.append({
-            'title': meeting.subject,
-            'start': start_dt.date().isoformat() if is_all_day else start_dt.isoformat(),
-            'end': (end_dt.date() + timedelta(days=1)).isoformat() if is_all_day else end_dt.isoformat(),
+            'title': meeting['subject'],
+            'start': start_day.isoformat() if is_all_day else start_dt.isoformat(),
+            'end': (end_day + timedelta(days=1)).isoformat() if is_all_day else end_dt.isoformat(),
             'allDay': is_all_day,
             'backgroundColor': color,
             'borderColor': color,
             'extendedProps': {
                 'type': 'meeting',
-                'id': meeting.id,
-                'user': meeting.user.username,
-                'range': f"{start_dt.strftime('%Y-%m-%d %p %I:%M')} ~ {end_dt.strftime('%Y-%m-%d %p %I:%M')}",
-                'purpose': meeting.subject,
+                'id': meeting_id,
+                'user': meeting['user__username'],
+                'range': f"{_fmt_ampm(start_dt)} ~ {_fmt_ampm(end_dt)}",
+                'purpose': meeting['subject'],
                 'mine': mine_for_color,
-                'title': meeting.subject,
-                'participants': participant_names,
+                'title': meeting['subject'],
+                'participants': meeting_participants[meeting_id],
                 'canManage': owner,
-                'editUrl': reverse('meeting_update', args=[meeting.id]) if owner else '',
-                'deleteUrl': reverse('meeting_delete', args=[meeting.id]) if owner else '',
+                'editUrl': url_templates['meeting_update'].format(meeting_id) if owner else '',
+                'deleteUrl': url_templates['meeting_delete'].format(meeting_id) if owner else '',
             },
             'editable': owner,
         })
 
-    personal_qs = PersonalEvent.objects.filter(user=request.user)
-    for p in personal_qs:
-        is_all_day = getattr(p, 'all_day', False)
-        start_dt = timezone.localtime(p.start_date)
-        end_dt = timezone.localtime(p.end_date)
+    # 개인 일정은 본인 것만 조회하므로 사용자 조인 없이 이름을 그대로 사용
+    username = user.username
+    personal_rows = PersonalEvent.objects.filter(
+        user=user, end_date__gte=window_start_dt, start_date__lt=window_end_dt,
+    ).values('id', 'title', 'description', 'location', 'start_date', 'end_date', 'all_day')
+    for p in personal_rows:
+        is_all_day = p['all_day']
+        start_dt = timezone.localtime(p['start_date'])
+        end_dt = timezone.localtime(p['end_date'])
+        start_day, end_day = start_dt.date(), end_dt.date()
         color = '#be4bdb'
-        if start_dt.date() <= week_end and end_dt.date() >= today:
-            time_label = f"{start_dt.strftime('%m-%d')}" + (" 종일" if is_all_day else f" {start_dt.strftime('%H:%M')}") + (f" ~ {end_dt.strftime('%m-%d %H:%M')}" if not is_all_day else '')
-            location_label = p.location or '장소 미정'
-            weekly_highlights['personal'].append({
-                'title': p.title,
-                'detail': f"{location_label} · {time_label}",
-                'order': start_dt,
-            })
         calendar_events.append({
-            'title': p.title,
-            'start': start_dt.date().isoformat() if is_all_day else start_dt.isoformat(),
-            'end': (end_dt.date() + timedelta(days=1)).isoformat() if is_all_day else end_dt.isoformat(),
+            'title': p['title'],
+            'start': start_day.isoformat() if is_all_day else start_dt.isoformat(),
+            'end': (end_day + timedelta(days=1)).isoformat() if is_all_day else end_dt.isoformat(),
             'allDay': is_all_day,
             'backgroundColor': color,
             'borderColor': color,
             'textColor': '#ffffff',
             'extendedProps': {
                 'type': 'personal',
-                'id': p.id,
-                'user': p.user.username,
-                'range': f"{start_dt.strftime('%Y-%m-%d %p %I:%M')} ~ {end_dt.strftime('%Y-%m-%d %p %I:%M')}",
-                'purpose': p.description or p.title,
+                'id': p['id'],
+                'user': username,
+                'range': f"{_fmt_ampm(start_dt)} ~ {_fmt_ampm(end_dt)}",
+                'purpose': p['description'] or p['title'],
                 'mine': True,
-                'title': p.title,
-                'location': p.location,
+                'title': p['title'],
+                'location': p['location'],
                 'canManage': True,
-                'editUrl': reverse('personal_update', args=[p.id]),
-                'deleteUrl': reverse('personal_delete', args=[p.id]),
+                'editUrl': url_templates['personal_update'].format(p['id']),
+                'deleteUrl': url_templates['personal_delete'].format(p['id']),
             },
             'editable': True,
         })
+    return calendar_events
+
+
+@login_required
+def dashboard(request):
+    leave_balance = LeaveBalance.objects.filter(user=request.user).first()
+    if not leave_balance:
+        leave_balance = LeaveBalance(user=request.user, total_leave=15, used_leave=0)
 
-    for key in weekly_highlights:
-        weekly_highlights[key] = sorted(weekly_highlights[key], key=lambda x: x.get('order'))
+    leave_summary = _leave_summary_for_user(request.user)
+    today = timezone.localdate()
+    week_end = today + timedelta(days=6)
+    weekly_highlights = _weekly_highlights(request.user, today, week_end)
 
+    my_leaves = LeaveRequest.objects.filter(user=request.user).order_by('-start_date')
+    my_trips = TripRequest.objects.filter(
+        Q(user=request.user) | Q(participants=request.user)
+    ).distinct().order_by('-start_date')
+    pending_trip_reports = TripRequest.objects.filter(
+        user=request.user,
+        status='approved'
+    ).filter(Q(report_content__isnull=True) | Q(report_content='')).count()
+
+    # 유형별 목록은 쿼리에서 이미 시작 시각 순으로 정렬되어 있으므로 한 번의 순회로 날짜별 묶음만 만든다
     type_labels = {'leave': '휴가', 'trip': '외부일정', 'meeting': '미팅', 'personal': '개인'}
     type_colors = {'leave': '#4c6ef5', 'trip': '#0dcaf0', 'meeting': '#20c997', 'personal': '#be4bdb'}
-    grouped_highlights = {}
+    grouped_highlights = defaultdict(list)
     for key, items in weekly_highlights.items():
         for item in items:
-            order_val = item.get('order')
-            day = order_val.date() if hasattr(order_val, 'date') else order_val
-            if not day:
-                continue
-            grouped_highlights.setdefault(day, []).append({
-                'type': type_labels.get(key, ''),
-                'title': item.get('title'),
-                'detail': item.get('detail'),
-                'color': type_colors.get(key, '#6c757d'),
+            order_val = item['order']
+            day = order_val.date() if isinstance(order_val, datetime) else order_val
+            grouped_highlights[day].append({
+                'type': type_labels[key],
+                'title': item['title'],
+                'detail': item['detail'],
+                'color': type_colors[key],
             })
 
-    weekly_highlights_by_date = []
-    for day in sorted(grouped_highlights.keys()):
-        weekly_highlights_by_date.append({
-            'label': day.strftime('%m/%d'),
-            'items': grouped_highlights[day],
-        })
+    weekly_highlights_by_date = [
+        {'label': day.strftime('%m/%d'), 'items': items}
+        for day, items in sorted(grouped_highlights.items())
+    ]
 
     return render(request, 'attendance/dashboard.html', {
         'leave_balance': leave_balance,
@@ -531,13 +699,35 @@ def dashboard(request):
         'my_leaves': my_leaves,
         'my_trips': my_trips,
         'pending_trip_reports': pending_trip_reports,
-        'calendar_events_json': json.dumps(calendar_events, ensure_ascii=False),
         'weekly_highlights': weekly_highlights,
         'week_range_label': f"{today.strftime('%m/%d')} ~ {week_end.strftime('%m/%d')}",
-        'weekly_highlights_by_date_json': json.dumps(weekly_highlights_by_date, ensure_ascii=False),
+        'weekly_highlights_by_date_json': json.dumps(weekly_highlights_by_date, ensure_ascii=False, separators=(',', ':')),
     })
 
 
+@login_required
+def calendar_events_api(request):
+    """Calendar events for the range FullCalendar is currently showing."""
+    start_dt = _parse_iso_datetime(request.GET.get('start'))
+    end_dt = _parse_iso_datetime(request.GET.get('end'))
+    window_start = window_end = None
+    if start_dt and end_dt and start_dt < end_dt:
+        try:
+            # FullCalendar의 end는 배타적이므로 하루 앞당겨 포함 구간으로 맞춘다
+            window_start, window_end = start_dt.date(), (end_dt - timedelta(days=1)).date()
+        except OverflowError:
+            pass
+        # date.min/date.max 부근처럼 자정 경계를 만들 수 없는 구간은 기본 구간으로 대체
+        if window_start is not None and None in _local_date_bounds(window_start, window_end):
+            window_start = window_end = None
+    if window_start is None:
+        today = timezone.localdate()
+        window_start = today - timedelta(days=CALENDAR_WINDOW_PAST_DAYS)
+        window_end = today + timedelta(days=CALENDAR_WINDOW_FUTURE_DAYS)
+    events = _calendar_events_for_user(request.user, window_start, window_end)
+    return JsonResponse(events, safe=False, json_dumps_params={'ensure_ascii': False, 'separators': (',', ':')})
+
+
 @login_required
 def leave_create(request):
     if request.method == 'POST':
@@ -547,10 +737,10 @@ def leave_create(request):
             leave_req.user = request.user
             leave_req.save()
             approvers = [form.cleaned_data.get('approver1'), form.cleaned_data.get('approver2'), form.cleaned_data.get('approver3')]
-            order = 1
-            for approver in [a for a in approvers if a]:
-                LeaveApprovalStep.objects.create(leave=leave_req, approver=approver, order=order)
-                order += 1
+            LeaveApprovalStep.objects.bulk_create([
+                LeaveApprovalStep(leave=leave_req, approver_id=approver_id, order=order)
+                for order, approver_id in enumerate((a for a in approvers if a), start=1)
+            ])
             messages.success(request, '휴가 신청이 완료되었습니다.')
             return redirect('dashboard')
     else:
@@ -977,32 +1167,20 @@ def trip_report_quick_update(request):
 
 
 @login_required
+@require_groups('휴가 결재권자', '경영관리부', message='휴가 결재 권한이 필요합니다.')
 def leave_approval_list(request):
-    if not _user_in_groups(request.user, ['휴가 결재권자', '경영관리부']):
-        return HttpResponseForbidden('휴가 결재 권한이 필요합니다.')
-
-    pending_steps = LeaveApprovalStep.objects.filter(
-        approver=request.user,
-        status='pending',
-        leave__status='pending',
-    ).select_related('leave', 'leave__user').prefetch_related('leave__approval_steps__approver').order_by('order', 'leave__start_date')
-
-    actionable = []
-    for step in pending_steps:
-        prior_exists = step.leave.approval_steps.filter(order__lt=step.order).exclude(status='approved').exists()
-        if not prior_exists:
-            actionable.append(step)
-
     if request.method == 'POST':
         action = request.POST.get('action')
         step_id = request.POST.get('step_id')
-        step = get_object_or_404(LeaveApprovalStep, pk=step_id, approver=request.user)
+        step = get_object_or_404(LeaveApprovalStep.objects.select_related('leave__user'), pk=step_id, approver=request.user)
         leave = step.leave
         if leave.status != 'pending' or step.status != 'pending':
             messages.warning(request, '이미 처리된 신청입니다.')
             return redirect('leave_approval')
 
-        if leave.approval_steps.filter(order__lt=step.order).exclude(status='approved').exists():
+        # 결재 단계는 최대 3개이므로 한 번 읽어 이전 단계/남은 단계 확인에 재사용
+        leave_steps = list(leave.approval_steps.all())
+        if any(s.order < step.order and s.status != 'approved' for s in leave_steps):
             messages.warning(request, '이전 결재가 완료되어야 합니다.')
             return redirect('leave_approval')
 
@@ -1016,7 +1194,7 @@ def leave_approval_list(request):
         step.save()
 
         if step.status == 'approved':
-            remaining_pending = leave.approval_steps.filter(status='pending').exists()
+            remaining_pending = any(s.pk != step.pk and s.status == 'pending' for s in leave_steps)
             if not remaining_pending:
                 leave.status = 'approved'
         leave.save()
@@ -1027,6 +1205,19 @@ def leave_approval_list(request):
             messages.info(request, f'{leave.user.username}님의 휴가를 반려했습니다.')
         return redirect('leave_approval')
 
+    pending_steps = LeaveApprovalStep.objects.filter(
+        approver=request.user,
+        status='pending',
+        leave__status='pending',
+    ).select_related('leave', 'leave__user').prefetch_related('leave__approval_steps__approver').order_by('order', 'leave__start_date')
+
+    actionable = []
+    for step in pending_steps:
+        # prefetch된 결재 단계 목록에서 확인 (filter()는 prefetch 캐시를 우회함)
+        prior_exists = any(s.order < step.order and s.status != 'approved' for s in step.leave.approval_steps.all())
+        if not prior_exists:
+            actionable.append(step)
+
     return render(request, 'attendance/leave_approval.html', {'actionable_steps': actionable})
 
 
@@ -1041,10 +1232,8 @@ def leave_delete(request, leave_id):
 
 
 @login_required
+@require_groups('출장 결재권자', message='출장 결재 권한이 필요합니다.')
 def trip_approval_list(request):
-    if not _user_in_groups(request.user, ['출장 결재권자']):
-        return HttpResponseForbidden('출장 결재 권한이 필요합니다.')
-
     pending = TripRequest.objects.filter(status='pending').select_related('user').order_by('start_date')
 
     if request.method == 'POST':
@@ -1068,26 +1257,29 @@ def trip_approval_list(request):
 
 
 @login_required
+@require_groups('경영관리부', message='경영관리부 권한이 필요합니다.')
 def management_overview(request):
-    if not _user_in_groups(request.user, ['경영관리부']):
-        return HttpResponseForbidden('경영관리부 권한이 필요합니다.')
-
     User = get_user_model()
-    users = User.objects.all().order_by('username')
+    # 표에 필요한 컬럼만 조회 (비밀번호 해시 등 제외)
+    users = User.objects.only('id', 'username', 'department', 'position', 'join_date').order_by('username')
 
     user_rows = []
     total_leave = 0
     total_used = 0
     total_remaining = 0
-    usage_rates = []
+    total_rate = 0.0
+    rate_count = 0
+
+    used_map = _bulk_used_leave(users, timezone.localdate())
 
     for u in users:
-        summary = _leave_summary_for_user(u)
+        summary = _leave_summary_for_user(u, used_override=used_map.get(u.id, 0.0))
         total_leave += summary['earned']
         total_used += summary['used']
         total_remaining += summary['remaining']
         if summary['earned'] > 0:
-            usage_rates.append(summary['usage_rate'])
+            total_rate += summary['usage_rate']
+            rate_count += 1
         user_rows.append({
             'username': u.username,
             'department': getattr(u, 'department', ''),
@@ -1101,8 +1293,8 @@ def management_overview(request):
             'reset_date': summary['reset_date'],
         })
 
-    total_users = users.count()
-    avg_usage = round(sum(usage_rates) / len(usage_rates), 1) if usage_rates else 0
+    total_users = len(user_rows)
+    avg_usage = round(total_rate / rate_count, 1) if rate_count else 0
     avg_earned = round(total_leave / total_users, 1) if total_users else 0
     avg_remaining = round(total_remaining / total_users, 1) if total_users else 0
 
@@ -1116,11 +1308,8 @@ def management_overview(request):
 
 
 @login_required
+@require_groups(ADMIN_GROUP, '경영관리부', '외부일정 보고 수신자', message='외부일정 열람 권한이 필요합니다.')
 def external_schedule_history(request):
-    allowed_groups = [ADMIN_GROUP, '경영관리부', '외부일정 보고 수신자']
-    if not _user_in_groups(request.user, allowed_groups):
-        return HttpResponseForbidden('외부일정 열람 권한이 필요합니다.')
-
     status = request.GET.get('status', 'approved')
     keyword = request.GET.get('q', '').strip()
     start_from = request.GET.get('start_from', '')
@@ -1133,17 +1322,19 @@ def external_schedule_history(request):
 
     def _parse_date(val):
         try:
-            return datetime.strptime(val, '%Y-%m-%d').date()
+            return date.fromisoformat(val)
         except (TypeError, ValueError):
             return None
 
     start_from_dt = _parse_date(start_from)
     start_to_dt = _parse_date(start_to)
 
-    if start_from_dt:
-        trips = trips.filter(start_date__date__gte=start_from_dt)
-    if start_to_dt:
-        trips = trips.filter(end_date__date__lte=start_to_dt)
+    # __date 변환 대신 자정 경계와 직접 비교해야 start_date/end_date 인덱스를 사용할 수 있다
+    start_bound, end_bound = _local_date_bounds(start_from_dt, start_to_dt)
+    if start_bound:
+        trips = trips.filter(start_date__gte=start_bound)
+    if end_bound:
+        trips = trips.filter(end_date__lt=end_bound)
 
     if keyword:
         trips = trips.filter(
@@ -1172,10 +1363,8 @@ def external_schedule_history(request):
 
     return render(request, 'attendance/external_history.html', context)
 @login_required
+@require_groups('경영관리부', message='경영관리부 권한이 필요합니다.')
 def leave_history(request):
-    if not _user_in_groups(request.user, ['경영관리부']):
-        return HttpResponseForbidden('경영관리부 권한이 필요합니다.')
-
     status = request.GET.get('status', 'approved')
     leave_type = request.GET.get('leave_type', '')
     keyword = request.GET.get('q', '').strip()
@@ -1192,7 +1381,7 @@ def leave_history(request):
 
     def _parse_date(val):
         try:
-            return datetime.strptime(val, '%Y-%m-%d').date()
+            return date.fromisoformat(val)
         except (TypeError, ValueError):
             return None
 
@@ -1233,35 +1422,40 @@ def leave_history(request):
 
 
 @login_required
+@require_groups(ADMIN_GROUP, message='관리자 권한이 필요합니다.')
 def admin_role_management(request):
-    if not _user_in_groups(request.user, [ADMIN_GROUP]):
-        return HttpResponseForbidden('관리자 권한이 필요합니다.')
-
-    for name in ROLE_GROUPS:
-        Group.objects.get_or_create(name=name)
+    # 역할 그룹은 마이그레이션(0015)에서 생성되므로 한 번의 조회로 충분; 누군가 삭제한 경우에만 다시 만든다
+    group_map = {g.name: g for g in Group.objects.filter(name__in=ROLE_GROUPS)}
+    for name in ROLE_GROUPS_SET - group_map.keys():
+        group_map[name] = Group.objects.get_or_create(name=name)[0]
 
     User = get_user_model()
 
     if request.method == 'POST':
         user_id = request.POST.get('user_id')
-        selected = request.POST.getlist('groups')
+        selected = ROLE_GROUPS_SET.intersection(request.POST.getlist('groups'))
         target = get_object_or_404(User, pk=user_id)
-        target.groups.remove(*Group.objects.filter(name__in=ROLE_GROUPS))
-        if selected:
-            add_groups = Group.objects.filter(name__in=selected)
-            target.groups.add(*add_groups)
+        # 바뀐 권한만 추가/제거 (변경이 없으면 쓰기 쿼리 없음)
+        current = set(target.groups.filter(name__in=ROLE_GROUPS).values_list('name', flat=True))
+        to_remove = [group_map[name] for name in current - selected]
+        to_add = [group_map[name] for name in selected - current]
+        if to_remove:
+            target.groups.remove(*to_remove)
+        if to_add:
+            target.groups.add(*to_add)
         messages.success(request, f"{target.username}님의 권한을 업데이트했습니다.")
         return redirect('admin_roles')
 
-    group_map = {g.name: g for g in Group.objects.filter(name__in=ROLE_GROUPS)}
     user_rows = []
-    for u in User.objects.all().order_by('username'):
+    # 사용자별 그룹 조회 대신 prefetch로 가져오고, 500명 단위로 나눠 읽어 메모리 사용을 제한
+    users = User.objects.only('id', 'username', 'department', 'position').order_by('username').prefetch_related('groups')
+    for u in users.iterator(chunk_size=500):
         user_rows.append({
             'id': u.id,
             'username': u.username,
             'department': getattr(u, 'department', ''),
             'position': getattr(u, 'position', ''),
-            'groups': set(u.groups.values_list('name', flat=True)),
+            'groups': {g.name for g in u.groups.all()},
         })
 
     return render(request, 'attendance/admin_roles.html', {
@@ -1271,38 +1465,44 @@ def admin_role_management(request):
 
 
 @login_required
+@require_groups(ADMIN_GROUP, message='관리자 권한이 필요합니다.')
 def admin_user_management(request):
-    if not _user_in_groups(request.user, [ADMIN_GROUP]):
-        return HttpResponseForbidden('관리자 권한이 필요합니다.')
-
     User = get_user_model()
 
     if request.method == 'POST':
         action = request.POST.get('action')
         user_id = request.POST.get('user_id')
-        target = get_object_or_404(User, pk=user_id)
+
+        if action in ('update', 'reset_password'):
+            # 몇 개 컬럼만 바꾸므로 사용자 행 전체를 읽지 않고 이름만 확인 후 UPDATE
+            users = User.objects.filter(pk=user_id)
+            username = users.values_list('username', flat=True).first()
+            if username is None:
+                raise Http404
 
         if action == 'update':
-            target.email = request.POST.get('email', '').strip()
-            target.department = request.POST.get('department', '').strip()
-            target.position = request.POST.get('position', '').strip()
-            target.is_active = bool(request.POST.get('is_active'))
+            fields = {
+                'email': request.POST.get('email', '').strip(),
+                'department': request.POST.get('department', '').strip(),
+                'position': request.POST.get('position', '').strip(),
+                'is_active': bool(request.POST.get('is_active')),
+            }
             join_date_raw = request.POST.get('join_date', '').strip()
             if join_date_raw:
                 try:
-                    target.join_date = timezone.datetime.strptime(join_date_raw, '%Y-%m-%d').date()
+                    fields['join_date'] = date.fromisoformat(join_date_raw)
                 except ValueError:
                     messages.warning(request, '입사일 형식이 올바르지 않습니다. YYYY-MM-DD로 입력해주세요.')
-            target.save(update_fields=['email', 'department', 'position', 'is_active', 'join_date'])
-            messages.success(request, f"{target.username} 정보를 업데이트했습니다.")
+            users.update(**fields)
+            messages.success(request, f"{username} 정보를 업데이트했습니다.")
 
         elif action == 'reset_password':
             new_pw = User.objects.make_random_password()
-            target.set_password(new_pw)
-            target.save(update_fields=['password'])
-            messages.success(request, f"{target.username}의 비밀번호를 재설정했습니다: {new_pw}")
+            users.update(password=make_password(new_pw))
+            messages.success(request, f"{username}의 비밀번호를 재설정했습니다: {new_pw}")
 
         elif action == 'delete':
+            target = get_object_or_404(User, pk=user_id)
             if target == request.user:
                 messages.warning(request, '본인 계정은 삭제할 수 없습니다.')
             else:
@@ -1312,7 +1512,8 @@ def admin_user_management(request):
 
         return redirect('admin_users')
 
-    users = User.objects.all().order_by('username')
+    # 표에 표시하는 컬럼만 조회 (비밀번호 해시 등 제외)
+    users = User.objects.only('id', 'username', 'email', 'department', 'position', 'join_date', 'is_active').order_by('username')
     return render(request, 'attendance/admin_users.html', {'users': users})
 
 
@@ -1325,7 +1526,13 @@ def trip_report_inbox(request):
     start_date = request.GET.get('start_date', '').strip()
     end_date = request.GET.get('end_date', '').strip()
 
-    reports = TripRequest.objects.filter(report_content__isnull=False).exclude(report_content='').select_related('user').prefetch_related('participants')
+    # 페이지 목록이 캐시에 저장되므로 화면에 쓰는 컬럼만 조회 (사용자 비밀번호 해시 등 제외)
+    reports = (
+        TripRequest.objects.filter(report_content__isnull=False).exclude(report_content='')
+        .select_related('user')
+        .only('id', 'user', 'location', 'purpose', 'report_content', 'start_date', 'end_date', 'all_day', 'user__username')
+        .prefetch_related(Prefetch('participants', queryset=get_user_model().objects.only('id', 'username')))
+    )
 
     if q:
         reports = reports.filter(
@@ -1334,22 +1541,45 @@ def trip_report_inbox(request):
             Q(user__last_name__icontains=q)
         )
 
+    start_day = end_day = None
     if start_date:
         try:
-            reports = reports.filter(start_date__date__gte=timezone.datetime.strptime(start_date, '%Y-%m-%d').date())
+            start_day = date.fromisoformat(start_date)
         except ValueError:
             messages.warning(request, '시작일 형식이 올바르지 않습니다. YYYY-MM-DD로 입력해주세요.')
 
     if end_date:
         try:
-            reports = reports.filter(end_date__date__lte=timezone.datetime.strptime(end_date, '%Y-%m-%d').date())
+            end_day = date.fromisoformat(end_date)
         except ValueError:
             messages.warning(request, '종료일 형식이 올바르지 않습니다. YYYY-MM-DD로 입력해주세요.')
 
-    reports = reports.order_by('-start_date')
+    # __date 변환 대신 자정 경계와 직접 비교 (인덱스 사용 가능)
+    start_bound, end_bound = _local_date_bounds(start_day, end_day)
+    if start_bound:
+        reports = reports.filter(start_date__gte=start_bound)
+    if end_bound:
+        reports = reports.filter(end_date__lt=end_bound)
+
+    # 페이지 단위로 잘라야 participants prefetch도 해당 페이지 보고서에 대해서만 실행된다
+    reports = reports.order_by('-start_date', '-id')
+    paginator = Paginator(reports, 20)
+
+    # 같은 필터 조합은 전체 건수와 페이지별 보고서 목록을 캐시에서 재사용
+    filter_parts = (q, start_date, end_date)
+    # 건수를 먼저 채워야 잘못되거나 범위를 벗어난 page 값도 실제 페이지 번호로 정규화된다
+    paginator.count = cache.get_or_set(
+        trip_reports_cache_key(*filter_parts, 'count'), lambda: paginator.count, TRIP_REPORTS_CACHE_TTL,
+    )
+    page_obj = paginator.get_page(request.GET.get('page'))  # 슬라이스만 만들고 아직 조회하지 않음
+    page_obj.object_list = cache.get_or_set(
+        trip_reports_cache_key(*filter_parts, page_obj.number), lambda: list(page_obj.object_list), TRIP_REPORTS_CACHE_TTL,
+    )
 
     return render(request, 'attendance/trip_report_inbox.html', {
-        'reports': reports,
+        'reports': page_obj,
+        'page_obj': page_obj,
+        'paginator': paginator,
         'filter_q': q,
         'filter_start_date': start_date,
         'filter_end_date': end_date,
@@ -1357,20 +1587,25 @@ def trip_report_inbox(request):
 
 
 @login_required
+@require_groups(ADMIN_GROUP, message='관리자 권한이 필요합니다.')
 def trip_report_recipients(request):
-    if not _user_in_groups(request.user, [ADMIN_GROUP]):
-        return HttpResponseForbidden('관리자 권한이 필요합니다.')
-
     User = get_user_model()
     users = User.objects.all().order_by('username')
 
     if request.method == 'POST':
         selected_ids = request.POST.getlist('recipients')
-        TripReportRecipient.objects.all().delete()
-        if selected_ids:
-            recipients = User.objects.filter(id__in=selected_ids)
-            for u in recipients:
-                TripReportRecipient.objects.create(user=u)
+        selected = set(User.objects.filter(id__in=selected_ids).values_list('id', flat=True)) if selected_ids else set()
+        with transaction.atomic():
+            # 전체 삭제 후 재생성 대신 바뀐 수신자만 반영
+            current = set(TripReportRecipient.objects.values_list('user_id', flat=True))
+            if current - selected:
+                TripReportRecipient.objects.filter(user_id__in=current - selected).delete()
+            if selected - current:
+                TripReportRecipient.objects.bulk_create(
+                    [TripReportRecipient(user_id=uid) for uid in selected - current], ignore_conflicts=True,
+                )
+        # bulk_create는 post_save 시그널을 보내지 않으므로 커밋 후 캐시를 직접 비운다
+        invalidate_trip_recipient_ids()
         messages.success(request, '출장 보고 수신자를 업데이트했습니다.')
         return redirect('trip_recipients')
 
@@ -12,5 +12,5 @@ urlpatterns = [
     path('accounts/password_change/', auth_views.PasswordChangeView.as_view(template_name='attendance/password_change.html', success_url='/accounts/password_change/done/'), name='password_change'),
     path('accounts/password_change/done/', auth_views.PasswordChangeDoneView.as_view(template_name='attendance/password_change_done.html'), name='password_change_done'),
     path('attendance/', include('attendance.urls')),
-    path('', RedirectView.as_view(url='/attendance/', permanent=False)),
+    path('', RedirectView.as_view(url='/attendance/', permanent=True)),
 ]
\ No newline at end of file